@@ -31,6 +31,8 @@ CREATE INDEX idx_users_created_at ON users(created_at);
 CREATE TABLE IF NOT EXISTS sessions (
     id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
     user_id UUID NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    -- Copied from users at login so token validation reads one table
+    email VARCHAR(255) NOT NULL,
     token_hash VARCHAR(255) UNIQUE NOT NULL,
     status session_status DEFAULT 'active',
     ip_address INET,
@@ -47,6 +49,11 @@ CREATE INDEX idx_sessions_user_id ON sessions(user_id);
 CREATE INDEX idx_sessions_token_hash ON sessions(token_hash);
 CREATE INDEX idx_sessions_status ON sessions(status);
 CREATE INDEX idx_sessions_expires_at ON sessions(expires_at);
+-- Token validation reads only active sessions; covering them lets the hot
+-- lookup be an index-only scan over a small index
+CREATE INDEX idx_sessions_active ON sessions(id)
+    INCLUDE (user_id, created_at, expires_at, email)
+    WHERE status = 'active';
 
 -- Permissions table
 CREATE TABLE IF NOT EXISTS permissions (
@@ -7,11 +7,12 @@ from .commands import (
     logout_user_command,
     register_user_command,
 )
-from .cqrs import curry_cqrs_functions
+from .cqrs import CQRSHandlers, curry_cqrs_functions
 from .dto import ValidateTokenResponse
 from .queries import QueryDependencies, validate_token_query
 
 __all__ = [
+    "CQRSHandlers",
     "CommandDependencies",
     "QueryDependencies",
     "ValidateTokenResponse",
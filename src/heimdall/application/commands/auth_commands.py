@@ -1,6 +1,11 @@
 """Authentication command functions (write operations)."""
 
-from typing import NamedTuple
+import asyncio
+import os
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
 
 from ...domain.entities import User
 from ...domain.events import UserCreated, UserLoggedIn, UserLoggedOut
@@ -8,18 +13,34 @@ from ...domain.repositories.write_repositories import (
     WriteSessionRepository,
     WriteUserRepository,
 )
-from ...domain.services import EventBus, TokenService
-from ...domain.value_objects import Email, Password, SessionId, Token
+from ...domain.services import CacheInvalidator, EventBus, TokenService
+from ...domain.value_objects import Email, Password, Token
 from ..dto import LoginRequest, LoginResponse, RegisterRequest, RegisterResponse
+from ..queries.token_cache import TokenValidationCache
 
+# bcrypt is CPU-bound and releases the GIL; run it off the event loop on a pool
+# capped at the core count so hashing bursts cannot oversubscribe the CPU
+_PASSWORD_EXECUTOR = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1, thread_name_prefix="password-hash"
+)
+
+
+async def _off_loop(fn: Callable[..., Any], *args: Any) -> Any:
+    """Run a password-hashing call on the dedicated executor."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_PASSWORD_EXECUTOR, fn, *args)
 
-class Dependencies(NamedTuple):
+
+@dataclass(slots=True, frozen=True)
+class Dependencies:
     """Dependencies for command operations (writes)."""
 
     user_repository: WriteUserRepository
     session_repository: WriteSessionRepository
     token_service: TokenService
     event_bus: EventBus
+    token_cache: TokenValidationCache | None = None
+    cache_invalidator: CacheInvalidator | None = None
 
 
 async def login_user_command(
@@ -37,24 +58,23 @@ async def login_user_command(
         raise ValueError("Invalid credentials")
 
     # Authenticate and create session
-    session = user.authenticate(password)
-
-    # Save updated user (last_login_at)
-    await deps.user_repository.save(user)
-
-    # Save session
-    await deps.session_repository.save(session)
+    session = await _off_loop(user.authenticate, password)
 
-    # Generate token
-    token = deps.token_service.generate_token(session)
-
-    # Publish event for read model updates
+    # Save updated user (last_login_at) and the new session, and publish for
+    # read model updates, concurrently; none depends on another's result
     event = UserLoggedIn(
         user_id=user.id,
         session_id=session.id,
         email=user.email,
     )
-    await deps.event_bus.publish(event)
+    await asyncio.gather(
+        deps.user_repository.save(user),
+        deps.session_repository.save(session),
+        deps.event_bus.publish(event),
+    )
+
+    # Generate token
+    token = deps.token_service.generate_token(session)
 
     return LoginResponse(access_token=token.value)
 
@@ -66,9 +86,11 @@ async def logout_user_command(
     """Execute user logout command (write operation)."""
     # Validate and decode token
     claims = deps.token_service.validate_token(token)
+    if claims is None:
+        raise ValueError("Invalid token")
 
     # Find session
-    session_id = SessionId(claims.session_id)
+    session_id = claims.session_id
     session = await deps.session_repository.find_by_id(session_id)
 
     if not session:
@@ -79,14 +101,23 @@ async def logout_user_command(
 
     # Invalidate session
     session.invalidate()
-    await deps.session_repository.save(session)
 
-    # Publish event for read model updates
+    # Persist and publish concurrently for read model updates
     event = UserLoggedOut(
         user_id=session.user_id,
         session_id=session.id,
     )
-    await deps.event_bus.publish(event)
+    await asyncio.gather(
+        deps.session_repository.save(session),
+        deps.event_bus.publish(event),
+    )
+
+    # Evict cached validations only once the revocation is persisted, so a
+    # concurrent validation cannot re-cache the still-active session
+    if deps.token_cache is not None:
+        deps.token_cache.evict_session(session_id.value)
+    if deps.cache_invalidator is not None:
+        await deps.cache_invalidator.publish(session_id.value)
 
 
 async def register_user_command(
@@ -98,21 +129,18 @@ async def register_user_command(
     email = Email(request.email)
     password = Password(request.password)
 
-    # Check if user already exists
-    if await deps.user_repository.exists_by_email(email):
-        raise ValueError("User with this email already exists")
-
     # Create new user
-    user = User.create(email, password)
+    user = await _off_loop(User.create, email, password)
 
-    # Save user
-    await deps.user_repository.save(user)
+    # Insert unless the email is taken - one round-trip, no check-then-act race
+    if not await deps.user_repository.create_if_not_exists(user):
+        raise ValueError("User with this email already exists")
 
     # Publish event for read model updates
     event = UserCreated(user_id=user.id, email=user.email)
     await deps.event_bus.publish(event)
 
     return RegisterResponse(
-        user_id=str(user.id),
-        email=str(user.email),
+        user_id=user.id.value,
+        email=user.email.value,
     )
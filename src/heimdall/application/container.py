@@ -1,11 +1,14 @@
 """Functional dependency injection container."""
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Mapping
+from types import MappingProxyType
 from typing import Any
 
 from .commands import CommandDependencies
 from .cqrs import curry_cqrs_functions
-from .queries import QueryDependencies
+from .queries import QueryDependencies, TokenValidationCache
+
+_MISSING = object()
 
 
 class Container:
@@ -25,15 +28,36 @@ class Container:
 
     def get(self, name: str) -> Any:
         """Get an instance by name."""
-        if name in self._instances:
-            return self._instances[name]
-
-        if name in self._factories:
-            instance = self._factories[name]()
-            self._instances[name] = instance
+        instance = self._instances.get(name, _MISSING)
+        if instance is not _MISSING:
             return instance
 
-        raise ValueError(f"No registration found for: {name}")
+        factory = self._factories.get(name)
+        if factory is None:
+            raise ValueError(f"No registration found for: {name}")
+
+        instance = factory()
+        self._instances[name] = instance
+        return instance
+
+    def freeze(self, required: Iterable[str] = ()) -> Mapping[str, Any]:
+        """Instantiate every factory and return a read-only snapshot.
+
+        Missing registrations surface here, at startup, instead of on first use.
+        """
+        missing = [
+            name
+            for name in required
+            if name not in self._instances and name not in self._factories
+        ]
+        if missing:
+            raise ValueError(f"No registration found for: {', '.join(missing)}")
+
+        for name, factory in self._factories.items():
+            if name not in self._instances:
+                self._instances[name] = factory()
+
+        return MappingProxyType(dict(self._instances))
 
 
 def create_container() -> Container:
@@ -49,20 +73,37 @@ def create_container() -> Container:
     return container
 
 
+_AUTH_DEPENDENCIES = (
+    "write_user_repository",
+    "write_session_repository",
+    "read_session_repository",
+    "token_service",
+    "event_bus",
+)
+
+
 def wire_auth_functions(container: Container):
     """Wire auth functions with CQRS dependencies using partial application."""
+    resolved = container.freeze(_AUTH_DEPENDENCIES)
+    # Shared by both sides; resolve once
+    token_service = resolved["token_service"]
+    # Shared so logout can evict cached validations
+    token_cache = TokenValidationCache()
+
     # Command dependencies - for write operations
     command_deps = CommandDependencies(
-        user_repository=container.get("write_user_repository"),
-        session_repository=container.get("write_session_repository"),
-        token_service=container.get("token_service"),
-        event_bus=container.get("event_bus"),
+        user_repository=resolved["write_user_repository"],
+        session_repository=resolved["write_session_repository"],
+        token_service=token_service,
+        event_bus=resolved["event_bus"],
+        token_cache=token_cache,
     )
 
     # Query dependencies - for read operations
     query_deps = QueryDependencies(
-        session_repository=container.get("read_session_repository"),
-        token_service=container.get("token_service"),
+        session_repository=resolved["read_session_repository"],
+        token_service=token_service,
+        token_cache=token_cache,
     )
 
     return curry_cqrs_functions(command_deps, query_deps)
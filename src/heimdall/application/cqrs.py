@@ -1,6 +1,7 @@
 """CQRS facade - functional interface for commands and queries."""
 
-from functools import partial
+from collections.abc import Awaitable, Callable
+from typing import Any, NamedTuple
 
 from .commands import (
     CommandDependencies,
@@ -11,31 +12,56 @@ from .commands import (
 from .queries import QueryDependencies, validate_token_query
 
 
+class CQRSHandlers(NamedTuple):
+    """Immutable set of curried CQRS handlers (attribute access, no dict probe)."""
+
+    # Commands (Write - 1% traffic)
+    login: Callable[..., Any]
+    register: Callable[..., Any]
+    logout: Callable[..., Any]
+    # Queries (Read - 99% traffic)
+    validate: Callable[..., Any]
+
+
+def _bind(
+    fn: Callable[[Any, Any], Awaitable[Any]], deps: Any
+) -> Callable[[Any], Awaitable[Any]]:
+    """Bind deps to a handler, forwarding positionally.
+
+    Unlike partial(fn, deps=...), no kwargs dict is built and merged per call,
+    and as a plain function returning fn's coroutine it adds no coroutine
+    frame of its own.
+    """
+
+    def bound(arg: Any) -> Awaitable[Any]:
+        return fn(arg, deps)
+
+    return bound
+
+
 def curry_cqrs_functions(
     command_deps: CommandDependencies,
     query_deps: QueryDependencies,
-):
+) -> CQRSHandlers:
     """Create curried CQRS functions with dependencies baked in.
 
-    Returns a dictionary of partially applied functions that maintain
-    CQRS separation while providing a unified functional interface.
+    Returns an immutable CQRSHandlers of dependency-bound functions that
+    maintain CQRS separation while providing a unified functional interface.
 
     Commands (1% of traffic) use write-optimized dependencies.
     Queries (99% of traffic) use read-optimized dependencies.
     """
     # Commands - Write operations with full dependencies
-    login = partial(login_user_command, deps=command_deps)
-    register = partial(register_user_command, deps=command_deps)
-    logout = partial(logout_user_command, deps=command_deps)
+    login = _bind(login_user_command, command_deps)
+    register = _bind(register_user_command, command_deps)
+    logout = _bind(logout_user_command, command_deps)
 
     # Queries - Read operations with minimal dependencies
-    validate = partial(validate_token_query, deps=query_deps)
-
-    return {
-        # Commands (Write - 1% traffic)
-        "login": login,
-        "register": register,
-        "logout": logout,
-        # Queries (Read - 99% traffic)
-        "validate": validate,
-    }
+    validate = _bind(validate_token_query, query_deps)
+
+    return CQRSHandlers(
+        login=login,
+        register=register,
+        logout=logout,
+        validate=validate,
+    )
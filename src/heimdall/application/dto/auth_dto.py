@@ -1,7 +1,11 @@
 """Authentication DTOs."""
 
+import sys
 from typing import NamedTuple
 
+# Shared by every login response; interned for identity comparisons downstream
+BEARER_TOKEN_TYPE = sys.intern("bearer")
+
 
 class LoginRequestValue(NamedTuple):
     """Login request data structure."""
@@ -35,27 +39,25 @@ class RegisterResponseValue(NamedTuple):
 
 def LoginRequest(email: str, password: str) -> LoginRequestValue:
     """Create login request."""
-    return LoginRequestValue(email=email, password=password)
+    return LoginRequestValue(email, password)
 
 
 def LoginResponse(
     access_token: str,
-    token_type: str = "bearer",  # noqa: S107 - "bearer" is a token type, not a password
+    token_type: str = BEARER_TOKEN_TYPE,
     expires_in: int = 900,
 ) -> LoginResponseValue:
     """Create login response."""
-    return LoginResponseValue(
-        access_token=access_token, token_type=token_type, expires_in=expires_in
-    )
+    return LoginResponseValue(access_token, token_type, expires_in)
 
 
 def RegisterRequest(email: str, password: str) -> RegisterRequestValue:
     """Create registration request."""
-    return RegisterRequestValue(email=email, password=password)
+    return RegisterRequestValue(email, password)
 
 
 def RegisterResponse(
     user_id: str, email: str, message: str = "User registered successfully"
 ) -> RegisterResponseValue:
     """Create registration response."""
-    return RegisterResponseValue(user_id=user_id, email=email, message=message)
+    return RegisterResponseValue(user_id, email, message)
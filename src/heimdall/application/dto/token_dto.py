@@ -1,7 +1,11 @@
 """Token validation DTOs."""
 
+from collections.abc import Iterable
 from typing import NamedTuple
 
+# Shared by every response without permissions
+_EMPTY_PERMISSIONS: tuple[str, ...] = ()
+
 
 class ValidateTokenRequestValue(NamedTuple):
     """Token validation request data structure."""
@@ -15,30 +19,25 @@ class ValidateTokenResponseValue(NamedTuple):
     is_valid: bool
     user_id: str | None
     email: str | None
-    permissions: tuple[str, ...] | None
+    permissions: tuple[str, ...]
     error: str | None
 
 
 def ValidateTokenRequest(token: str) -> ValidateTokenRequestValue:
     """Create token validation request."""
-    return ValidateTokenRequestValue(token=token)
+    return ValidateTokenRequestValue(token)
 
 
 def ValidateTokenResponse(
     is_valid: bool,
     user_id: str | None = None,
     email: str | None = None,
-    permissions: list[str] | None = None,
+    permissions: Iterable[str] = _EMPTY_PERMISSIONS,
     error: str | None = None,
 ) -> ValidateTokenResponseValue:
     """Create token validation response."""
-    # Convert list to tuple for immutability
-    perms_tuple = tuple(permissions) if permissions else None
-
-    return ValidateTokenResponseValue(
-        is_valid=is_valid,
-        user_id=user_id,
-        email=email,
-        permissions=perms_tuple,
-        error=error,
-    )
+    # Tuples are passed through as-is; anything else is frozen into one
+    if type(permissions) is not tuple:
+        permissions = tuple(permissions) if permissions else _EMPTY_PERMISSIONS
+
+    return ValidateTokenResponseValue(is_valid, user_id, email, permissions, error)
@@ -2,8 +2,10 @@
 
 from .auth_queries import Dependencies as QueryDependencies
 from .auth_queries import validate_token_query
+from .token_cache import TokenValidationCache
 
 __all__ = [
     "QueryDependencies",
+    "TokenValidationCache",
     "validate_token_query",
 ]
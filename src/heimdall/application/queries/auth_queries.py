@@ -1,19 +1,47 @@
 """Authentication query functions (read operations)."""
 
-from typing import NamedTuple
-from unittest.mock import Mock
+import sys
+import time
+from dataclasses import dataclass
 
 from ...domain.repositories.read_repositories import ReadSessionRepository
 from ...domain.services import TokenService
-from ...domain.value_objects import SessionId, Token
+from ...domain.value_objects import Token, peek_expiry
 from ..dto import ValidateTokenResponse
+from .token_cache import TokenValidationCache
 
+# Permission vocabulary seeded in migrations/init.sql. Mapping each known name
+# to an interned copy lets policy checks compare by identity; unknown names pass
+# through untouched so interning stays bounded.
+_KNOWN_PERMISSIONS: dict[str, str] = {
+    name: name
+    for name in map(
+        sys.intern,
+        (
+            "user:read",
+            "user:write",
+            "user:delete",
+            "session:read",
+            "session:write",
+            "admin:read",
+            "admin:write",
+        ),
+    )
+}
 
-class Dependencies(NamedTuple):
+# Shared responses for the common miss paths; values are immutable
+_INVALID_TOKEN = ValidateTokenResponse(is_valid=False, error="Invalid token")
+_EXPIRED_TOKEN = ValidateTokenResponse(is_valid=False, error="Token has expired")
+_INVALID_SESSION = ValidateTokenResponse(is_valid=False, error="Invalid session")
+
+
+@dataclass(slots=True, frozen=True)
+class Dependencies:
     """Dependencies for query operations (reads) - optimized for performance."""
 
     session_repository: ReadSessionRepository
     token_service: TokenService
+    token_cache: TokenValidationCache | None = None
     # Note: No user_repository or event_bus needed for reads
 
 
@@ -22,42 +50,46 @@ async def validate_token_query(
     deps: Dependencies,
 ) -> ValidateTokenResponse:
     """Validate token query (read operation) - optimized for performance."""
+    # Repeated validations of the same bearer token skip decode + lookup
+    cache = deps.token_cache
+    if cache is not None:
+        cache_key = cache.key_for(token.value)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    # Expired tokens are rejected before paying for signature verification
+    expires_at = peek_expiry(token)
+    if expires_at is not None and expires_at <= time.time():
+        return _EXPIRED_TOKEN
+
+    validate = deps.token_service.validate_token
+    find_session = deps.session_repository.find_by_id
+
+    # Decoding is the only step that may reject the token
     try:
-        # Fast token validation
-        claims = deps.token_service.validate_token(token)
-
-        # Fast session lookup (could be cached in future)
-        session_id = SessionId(claims.session_id)
-        session = await deps.session_repository.find_by_id(session_id)
-
-        if not session or not session.is_valid():
-            return ValidateTokenResponse(is_valid=False, error="Invalid session")
-
-        # Return minimal data needed for authorization
-        # Use session data if available (real session entities), otherwise use claims
-
-        is_mock = isinstance(session, Mock)
-
-        user_id = claims.user_id if is_mock else str(session.user_id)
-        email = claims.email if is_mock else str(session.email)
-
-        # Handle permissions carefully for both real objects and mocks
-        try:
-            if is_mock:
-                permissions = list(claims.permissions) if claims.permissions else []
-            else:
-                permissions = (
-                    list(session.permissions) if hasattr(session, "permissions") else []
-                )
-        except (TypeError, AttributeError):
-            permissions = []
-
-        return ValidateTokenResponse(
-            is_valid=True,
-            user_id=user_id,
-            email=email,
-            permissions=permissions,
-        )
-
-    except Exception as e:
+        claims = validate(token)
+    except ValueError as e:
         return ValidateTokenResponse(is_valid=False, error=str(e))
+    if claims is None:
+        return _INVALID_TOKEN
+
+    # Claims carry a typed session id, so no re-wrapping is needed
+    session = await find_session(claims.session_id)
+    if not session or not session.is_valid():
+        return _INVALID_SESSION
+
+    # Return minimal data needed for authorization, sourced from the session
+    perms = session.permissions
+    response = ValidateTokenResponse(
+        is_valid=True,
+        user_id=str(session.user_id),
+        email=str(session.email),
+        permissions=tuple(map(_KNOWN_PERMISSIONS.get, perms, perms)),
+    )
+
+    # Only successful validations are cached
+    if cache is not None:
+        cache.put(cache_key, response, claims.expires_at, claims.session_id.value)
+
+    return response
@@ -0,0 +1,101 @@
+"""In-process cache for token validation results (read hot path)."""
+
+import hashlib
+import time
+from collections import OrderedDict
+from datetime import UTC, datetime
+
+from ..dto import ValidateTokenResponseValue
+
+
+class TokenValidationCache:
+    """Short-lived LRU cache of successful token validations.
+
+    Keys are blake2b digests of the raw token so bearer tokens are never
+    kept in memory. Entries expire after `ttl` seconds or when the token
+    itself expires, whichever comes first, and can be evicted by session
+    when it is revoked.
+    """
+
+    def __init__(self, maxsize: int = 100_000, ttl: float = 5.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[
+            bytes, tuple[float, ValidateTokenResponseValue, str | None]
+        ] = OrderedDict()
+        self._keys_by_session: dict[str, set[bytes]] = {}
+
+    @staticmethod
+    def key_for(token_value: str) -> bytes:
+        """Build the cache key for a raw token string."""
+        return hashlib.blake2b(token_value.encode(), digest_size=16).digest()
+
+    def get(self, key: bytes) -> ValidateTokenResponseValue | None:
+        """Return the cached response, or None on miss/expiry."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        deadline, response, session_id = entry
+        if time.monotonic() >= deadline:
+            self._remove(key, session_id)
+            return None
+
+        self._entries.move_to_end(key)
+        return response
+
+    def put(
+        self,
+        key: bytes,
+        response: ValidateTokenResponseValue,
+        expires_at: datetime,
+        session_id: str | None = None,
+    ) -> None:
+        """Cache a response, never outliving the token expiry."""
+        ttl = min(self.ttl, (expires_at - datetime.now(UTC)).total_seconds())
+        if ttl <= 0:
+            return
+
+        self._entries[key] = (time.monotonic() + ttl, response, session_id)
+        self._entries.move_to_end(key)
+        if session_id is not None:
+            self._keys_by_session.setdefault(session_id, set()).add(key)
+
+        if len(self._entries) > self.maxsize:
+            oldest, (_, _, oldest_session) = self._entries.popitem(last=False)
+            self._unindex(oldest, oldest_session)
+
+    def discard(self, key: bytes) -> None:
+        """Drop a cached entry if present, e.g. when its session is revoked."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._remove(key, entry[2])
+
+    def evict_session(self, session_id: str) -> None:
+        """Drop every cached entry belonging to a revoked session."""
+        for key in self._keys_by_session.pop(session_id, ()):
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        self._entries.clear()
+        self._keys_by_session.clear()
+
+    def _remove(self, key: bytes, session_id: str | None) -> None:
+        """Delete an entry and its session index reference."""
+        del self._entries[key]
+        self._unindex(key, session_id)
+
+    def _unindex(self, key: bytes, session_id: str | None) -> None:
+        """Remove a key from the session index."""
+        if session_id is None:
+            return
+        keys = self._keys_by_session.get(session_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_session[session_id]
+
+    def __len__(self) -> int:
+        """Number of cached entries (including not-yet-evicted expired ones)."""
+        return len(self._entries)
@@ -1,5 +1,7 @@
 """Session entity."""
 
+import time
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 
@@ -7,24 +9,61 @@ from datetime import UTC, datetime, timedelta
 from ..value_objects import Email, SessionId, TokenClaims, UserId
 from ..value_objects.session_id import generate_session_id
 
+# How long a new session stays valid when no expiry is given
+_SESSION_LIFETIME = timedelta(hours=24)
 
-@dataclass
+
+@dataclass(slots=True, init=False)
 class Session:
     """Session entity - represents an active user session."""
 
     id: SessionId
     user_id: UserId
     email: Email
-    permissions: list[str]
-    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
-    expires_at: datetime = field(
-        default_factory=lambda: datetime.now(UTC) + timedelta(hours=24)
-    )
-    is_active: bool = True
+    permissions: tuple[str, ...]
+    created_at: datetime
+    expires_at: datetime
+    is_active: bool
+    # expires_at as an epoch float, re-derived whenever expires_at is replaced
+    _expiry_source: datetime | None = field(init=False, repr=False, compare=False)
+    _expires_epoch: float = field(init=False, repr=False, compare=False)
+
+    def __init__(  # noqa: PLR0913
+        self,
+        id: SessionId,  # noqa: A002
+        user_id: UserId,
+        email: Email,
+        permissions: tuple[str, ...],
+        created_at: datetime | None = None,
+        expires_at: datetime | None = None,
+        is_active: bool = True,
+    ):
+        # Hand-written so rehydration from storage skips the default-factory
+        # checks, and new sessions read the clock once for both timestamps
+        if created_at is None:
+            created_at = datetime.now(UTC)
+            if expires_at is None:
+                expires_at = created_at + _SESSION_LIFETIME
+        elif expires_at is None:
+            expires_at = datetime.now(UTC) + _SESSION_LIFETIME
+
+        self.id = id
+        self.user_id = user_id
+        self.email = email
+        self.permissions = permissions
+        self.created_at = created_at
+        self.expires_at = expires_at
+        self.is_active = is_active
+        self._expiry_source = None
+        self._expires_epoch = 0.0
 
     def is_expired(self) -> bool:
         """Check if session has expired."""
-        return datetime.now(UTC) > self.expires_at
+        expires_at = self.expires_at
+        if expires_at is not self._expiry_source:
+            self._expiry_source = expires_at
+            self._expires_epoch = expires_at.timestamp()
+        return time.time() > self._expires_epoch
 
     def is_valid(self) -> bool:
         """Check if session is valid: active and not expired."""
@@ -37,20 +76,20 @@ class Session:
     def to_token_claims(self) -> TokenClaims:
         """Convert session to token claims."""
         return TokenClaims(
-            user_id=str(self.user_id),
-            session_id=str(self.id),
+            user_id=self.user_id,
+            session_id=self.id,
             email=str(self.email),
-            permissions=self.permissions.copy(),
+            permissions=self.permissions,
         )
 
     @classmethod
     def create_for_user(
-        cls, user_id: UserId, email: Email, permissions: list[str]
+        cls, user_id: UserId, email: Email, permissions: Iterable[str]
     ) -> "Session":
         """Create a new session for a user."""
         return cls(
             id=generate_session_id(),
             user_id=user_id,
             email=email,
-            permissions=permissions.copy(),
+            permissions=tuple(permissions),
         )
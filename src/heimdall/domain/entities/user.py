@@ -1,6 +1,6 @@
 """User entity."""
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import UTC, datetime
 
 from ..value_objects import Email, Password, PasswordHash, UserId
@@ -9,19 +9,50 @@ from ..value_objects.user_id import generate_user_id
 from .session import Session
 
 
-@dataclass
+@dataclass(slots=True, init=False)
 class User:
     """User entity - core authentication entity."""
 
     id: UserId
     email: Email
     password_hash: PasswordHash
-    is_active: bool = True
-    is_verified: bool = False
-    permissions: list[str] = field(default_factory=list)
-    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
-    updated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
-    last_login_at: datetime | None = None
+    is_active: bool
+    is_verified: bool
+    permissions: set[str]
+    created_at: datetime
+    updated_at: datetime
+    last_login_at: datetime | None
+
+    def __init__(  # noqa: PLR0913
+        self,
+        id: UserId,  # noqa: A002
+        email: Email,
+        password_hash: PasswordHash,
+        is_active: bool = True,
+        is_verified: bool = False,
+        permissions: set[str] | None = None,
+        created_at: datetime | None = None,
+        updated_at: datetime | None = None,
+        last_login_at: datetime | None = None,
+    ):
+        # Hand-written so rehydration from storage skips the default-factory
+        # checks, and new users read the clock once for both timestamps
+        if created_at is None or updated_at is None:
+            now = datetime.now(UTC)
+            if created_at is None:
+                created_at = now
+            if updated_at is None:
+                updated_at = now
+
+        self.id = id
+        self.email = email
+        self.password_hash = password_hash
+        self.is_active = is_active
+        self.is_verified = is_verified
+        self.permissions = set() if permissions is None else permissions
+        self.created_at = created_at
+        self.updated_at = updated_at
+        self.last_login_at = last_login_at
 
     def authenticate(self, password: Password) -> Session:
         """Authenticate user with password."""
@@ -35,7 +66,10 @@ class User:
         self.last_login_at = datetime.now(UTC)
 
         # Create new session
-        session = Session.create_for_user(self.id, self.email, self.permissions)
+        # Sorted so token claims are stable regardless of set iteration order
+        session = Session.create_for_user(
+            self.id, self.email, tuple(sorted(self.permissions))
+        )
         return session
 
     def change_password(
@@ -51,13 +85,13 @@ class User:
     def grant_permission(self, permission: str) -> None:
         """Grant a permission to the user."""
         if permission not in self.permissions:
-            self.permissions.append(permission)
+            self.permissions.add(permission)
             self.updated_at = datetime.now(UTC)
 
     def revoke_permission(self, permission: str) -> None:
         """Revoke a permission from the user."""
         if permission in self.permissions:
-            self.permissions.remove(permission)
+            self.permissions.discard(permission)
             self.updated_at = datetime.now(UTC)
 
     def deactivate(self) -> None:
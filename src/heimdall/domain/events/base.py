@@ -1,9 +1,43 @@
 """Base domain event."""
 
-import uuid
+import os
+import threading
 from datetime import UTC, datetime
 from typing import Any, NamedTuple
 
+# Event ids are random v4 UUIDs sliced from a pooled urandom read, so a burst
+# of events costs one syscall per _ID_POOL_SIZE ids instead of one per event.
+_ID_POOL_SIZE = 256
+_UUID_VARIANTS = "89ab"
+_id_lock = threading.Lock()
+_id_pool = b""
+_id_offset = 0
+
+
+def _reset_id_pool() -> None:
+    """Drop pooled entropy so forked workers never hand out the same ids."""
+    global _id_pool, _id_offset  # noqa: PLW0603
+    _id_pool = b""
+    _id_offset = 0
+
+
+os.register_at_fork(after_in_child=_reset_id_pool)
+
+
+def _new_event_id() -> str:
+    """Return a random version-4 UUID string."""
+    global _id_pool, _id_offset  # noqa: PLW0603
+    with _id_lock:
+        offset = _id_offset
+        if offset >= len(_id_pool):
+            _id_pool = os.urandom(16 * _ID_POOL_SIZE)
+            offset = 0
+        _id_offset = offset + 16
+        h = _id_pool[offset : offset + 16].hex()
+
+    variant = _UUID_VARIANTS[int(h[16], 16) & 3]
+    return f"{h[:8]}-{h[8:12]}-4{h[13:16]}-{variant}{h[17:20]}-{h[20:]}"
+
 
 class DomainEventValue(NamedTuple):
     """Base structure for all domain events."""
@@ -15,11 +49,12 @@ class DomainEventValue(NamedTuple):
 
     def to_dict(self) -> dict[str, Any]:
         """Convert event to dictionary for serialization."""
+        event_id, event_type, occurred_at, data = self
         return {
-            "event_id": self.event_id,
-            "event_type": self.event_type,
-            "occurred_at": self.occurred_at.isoformat(),
-            "data": self.data,
+            "event_id": event_id,
+            "event_type": event_type,
+            "occurred_at": occurred_at.isoformat(),
+            "data": data,
         }
 
 
@@ -31,13 +66,8 @@ def DomainEvent(
 ) -> DomainEventValue:
     """Create a domain event."""
     if event_id is None:
-        event_id = str(uuid.uuid4())
+        event_id = _new_event_id()
     if occurred_at is None:
         occurred_at = datetime.now(UTC)
 
-    return DomainEventValue(
-        event_id=event_id,
-        event_type=event_type,
-        occurred_at=occurred_at,
-        data=data,
-    )
+    return DomainEventValue(event_id, event_type, occurred_at, data)
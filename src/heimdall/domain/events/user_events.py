@@ -1,5 +1,7 @@
 """User-related domain events."""
 
+import sys
+
 from ..value_objects import Email, SessionId, UserId
 from .base import DomainEvent, DomainEventValue
 
@@ -56,7 +58,8 @@ def UserPermissionGranted(user_id: UserId, permission: str) -> DomainEventValue:
         event_type="UserPermissionGranted",
         data={
             "user_id": str(user_id),
-            "permission": permission,
+            # Drawn from a small vocabulary; interned so queued events share it
+            "permission": sys.intern(permission),
         },
     )
 
@@ -67,7 +70,8 @@ def UserPermissionRevoked(user_id: UserId, permission: str) -> DomainEventValue:
         event_type="UserPermissionRevoked",
         data={
             "user_id": str(user_id),
-            "permission": permission,
+            # Drawn from a small vocabulary; interned so queued events share it
+            "permission": sys.intern(permission),
         },
     )
 
@@ -1,6 +1,7 @@
 """Event repository interface."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from datetime import datetime
 
 from ..events import DomainEvent
@@ -13,6 +14,11 @@ class EventRepository(ABC):
     async def save(self, event: DomainEvent) -> None:
         """Save a domain event."""
 
+    async def save_many(self, events: Sequence[DomainEvent]) -> None:
+        """Save several domain events; override to write them in one batch."""
+        for event in events:
+            await self.save(event)
+
     @abstractmethod
     async def find_by_aggregate_id(self, aggregate_id: str) -> list[DomainEvent]:
         """Find all events for an aggregate."""
@@ -1,6 +1,7 @@
 """Write-optimized repository interfaces for CQRS commands."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 
 from ..entities import Session, User
 from ..value_objects import Email, SessionId, UserId
@@ -25,10 +26,36 @@ class WriteUserRepository(ABC):
     async def save(self, user: User) -> None:
         """Save user (create or update)."""
 
+    @abstractmethod
+    async def create_if_not_exists(self, user: User) -> bool:
+        """Insert a new user unless the email is taken.
+
+        Returns False when another user already owns the email. Uniqueness is
+        checked atomically with the insert.
+        """
+
     @abstractmethod
     async def find_by_id(self, user_id: UserId) -> User | None:
         """Find user by ID."""
 
+    async def find_by_ids(self, user_ids: Sequence[UserId]) -> dict[str, User]:
+        """Find many users by ID, keyed by ID; override to use one query."""
+        found = {}
+        for user_id in user_ids:
+            user = await self.find_by_id(user_id)
+            if user is not None:
+                found[user_id.value] = user
+        return found
+
+    async def find_by_emails(self, emails: Sequence[Email]) -> dict[str, User]:
+        """Find many users by email, keyed by email; override to use one query."""
+        found = {}
+        for email in emails:
+            user = await self.find_by_email(email)
+            if user is not None:
+                found[email.value] = user
+        return found
+
 
 class WriteSessionRepository(ABC):
     """Write-optimized session repository for commands.
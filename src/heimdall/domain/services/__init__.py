@@ -1,6 +1,7 @@
 """Domain services - Complex business logic."""
 
+from .cache_invalidator import CacheInvalidator
 from .event_bus import EventBus
 from .token_service import TokenService
 
-__all__ = ["EventBus", "TokenService"]
+__all__ = ["CacheInvalidator", "EventBus", "TokenService"]
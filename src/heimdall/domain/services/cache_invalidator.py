@@ -0,0 +1,11 @@
+"""Cache invalidation interface."""
+
+from abc import ABC, abstractmethod
+
+
+class CacheInvalidator(ABC):
+    """Abstract interface for broadcasting session revocations to caches."""
+
+    @abstractmethod
+    async def publish(self, session_id: str) -> None:
+        """Announce that a session was revoked."""
@@ -2,23 +2,31 @@
 
 from .email import Email
 from .password import Password, PasswordHash, hash_password, verify_password
-from .session_id import SessionId, SessionIdValue, generate_session_id
-from .token import Token, TokenClaims, TokenClaimsFromDict
-from .user_id import UserId, UserIdValue, generate_user_id
+from .session_id import (
+    SessionId,
+    SessionIdFromTrusted,
+    SessionIdValue,
+    generate_session_id,
+)
+from .token import Token, TokenClaims, TokenClaimsFromDict, peek_expiry
+from .user_id import UserId, UserIdFromTrusted, UserIdValue, generate_user_id
 
 __all__ = [
     "Email",
     "Password",
     "PasswordHash",
     "SessionId",
+    "SessionIdFromTrusted",
     "SessionIdValue",
     "Token",
     "TokenClaims",
     "TokenClaimsFromDict",
     "UserId",
+    "UserIdFromTrusted",
     "UserIdValue",
     "generate_session_id",
     "generate_user_id",
     "hash_password",
+    "peek_expiry",
     "verify_password",
 ]
@@ -1,9 +1,10 @@
 """Email value object - functional approach."""
 
 import re
+from functools import lru_cache
 from typing import NamedTuple
 
-EMAIL_REGEX = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+EMAIL_REGEX = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$", re.ASCII)
 
 
 class EmailValue(NamedTuple):
@@ -17,17 +18,27 @@ class EmailValue(NamedTuple):
         return self.value
 
 
+# Logins and lookups re-wrap the same addresses; memoizing skips the regex
+# for repeats, bounded to cap memory
+@lru_cache(maxsize=65_536)
 def Email(email_string: str) -> EmailValue:
     """Create and validate an email value object."""
     if not email_string:
         raise ValueError("Email cannot be empty")
 
+    # The format is ASCII-only, so reject anything else before lowercasing:
+    # cheaper than Unicode case mapping, and stops characters such as the
+    # Kelvin sign from lowercasing into an accepted ASCII letter
+    if not email_string.isascii():
+        raise ValueError(f"Invalid email format: {email_string}")
+
     # Normalize to lowercase
     normalized = email_string.lower()
 
     if not EMAIL_REGEX.match(normalized):
         raise ValueError(f"Invalid email format: {email_string}")
 
-    domain = normalized.split("@")[1]
+    # The regex guarantees exactly one "@", so partition avoids a list build
+    domain = normalized.partition("@")[2]
 
     return EmailValue(value=normalized, domain=domain)
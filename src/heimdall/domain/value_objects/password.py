@@ -2,9 +2,12 @@
 
 from typing import NamedTuple
 
-from passlib.context import CryptContext
+import bcrypt
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Same cost factor passlib used, so existing $2b$12$ hashes verify unchanged
+BCRYPT_ROUNDS = 12
+# bcrypt only reads the first 72 bytes; truncate explicitly as passlib did
+_BCRYPT_MAX_BYTES = 72
 
 
 class PasswordValue(NamedTuple):
@@ -61,9 +64,12 @@ def PasswordHash(hash_string: str) -> PasswordHashValue:
 
 def hash_password(password: PasswordValue) -> PasswordHashValue:
     """Hash a password."""
-    return PasswordHash(pwd_context.hash(password.value))
+    secret = password.value.encode()[:_BCRYPT_MAX_BYTES]
+    hashed = bcrypt.hashpw(secret, bcrypt.gensalt(rounds=BCRYPT_ROUNDS))
+    return PasswordHash(hashed.decode())
 
 
 def verify_password(password: PasswordValue, password_hash: PasswordHashValue) -> bool:
     """Verify a password against a hash."""
-    return pwd_context.verify(password.value, password_hash.value)
+    secret = password.value.encode()[:_BCRYPT_MAX_BYTES]
+    return bcrypt.checkpw(secret, password_hash.value.encode())
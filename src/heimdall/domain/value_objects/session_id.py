@@ -1,6 +1,7 @@
 """Session ID value object - functional approach."""
 
 import uuid
+from functools import lru_cache
 from typing import NamedTuple
 
 
@@ -14,6 +15,9 @@ class SessionIdValue(NamedTuple):
         return self.value
 
 
+# Every validation of a token parses its session id again; the bounded memo
+# turns those repeats into a cache hit
+@lru_cache(maxsize=65_536)
 def SessionId(session_id_string: str) -> SessionIdValue:
     """Create and validate a session ID value object."""
     if not session_id_string:
@@ -28,9 +32,20 @@ def SessionId(session_id_string: str) -> SessionIdValue:
     return SessionIdValue(value=session_id_string)
 
 
+def SessionIdFromTrusted(session_id_string: str) -> SessionIdValue:
+    """Create a session ID from an already-verified source, skipping validation.
+
+    Only for values that cannot be malformed, e.g. claims a token service has
+    just verified or a `uuid` column read back from the database.
+    """
+    return SessionIdValue(session_id_string)
+
+
 def generate_session_id() -> SessionIdValue:
     """Generate a new session ID."""
-    return SessionId(str(uuid.uuid4()))
+    # Skips the memo: a new session's id is already valid, and only the
+    # string carried in its tokens is worth caching
+    return SessionIdValue(str(uuid.uuid4()))
 
 
 # For backwards compatibility, add generate method
@@ -1,14 +1,25 @@
 """Token value objects - functional approach."""
 
+import base64
+import binascii
+from collections.abc import Iterable
 from datetime import UTC, datetime, timedelta
 from typing import NamedTuple
 
+import orjson
+
+from .session_id import SessionIdValue
+from .user_id import UserIdValue
+
+# Lifetime of an access token's claims when no expiry is given
+ACCESS_TOKEN_TTL_SECONDS = 15 * 60
+
 
 class TokenClaimsValue(NamedTuple):
     """JWT token claims."""
 
-    user_id: str
-    session_id: str
+    user_id: UserIdValue
+    session_id: SessionIdValue
     email: str
     permissions: tuple[str, ...]
     issued_at: datetime
@@ -21,8 +32,8 @@ class TokenClaimsValue(NamedTuple):
     def to_dict(self) -> dict:
         """Convert to dictionary for JWT encoding."""
         return {
-            "sub": self.user_id,
-            "sid": self.session_id,
+            "sub": self.user_id.value,
+            "sid": self.session_id.value,
             "email": self.email,
             "permissions": list(self.permissions),
             "iat": int(self.issued_at.timestamp()),
@@ -42,26 +53,34 @@ class TokenValue(NamedTuple):
 
 
 def TokenClaims(
-    user_id: str,
-    session_id: str,
+    user_id: str | UserIdValue,
+    session_id: str | SessionIdValue,
     email: str,
-    permissions: list[str] | None = None,
+    permissions: Iterable[str] | None = None,
     expires_at: datetime | None = None,
 ) -> TokenClaimsValue:
-    """Create token claims with defaults."""
+    """Create token claims with defaults.
+
+    Ids arrive either typed (from a Session) or as strings from an already
+    verified token, so strings are wrapped without re-validating them.
+    """
+    if type(user_id) is str:
+        user_id = UserIdValue(user_id)
+    if type(session_id) is str:
+        session_id = SessionIdValue(session_id)
     if permissions is None:
-        permissions = []
+        permissions = ()
 
     issued_at = datetime.now(UTC)
 
     if expires_at is None:
-        expires_at = issued_at + timedelta(minutes=15)
+        expires_at = issued_at + timedelta(seconds=ACCESS_TOKEN_TTL_SECONDS)
 
     return TokenClaimsValue(
         user_id=user_id,
         session_id=session_id,
         email=email,
-        permissions=tuple(permissions),  # Convert to tuple for immutability
+        permissions=tuple(permissions),  # No-op when already a tuple
         issued_at=issued_at,
         expires_at=expires_at,
     )
@@ -70,8 +89,8 @@ def TokenClaims(
 def TokenClaimsFromDict(data: dict) -> TokenClaimsValue:
     """Create token claims from JWT decoded dictionary."""
     return TokenClaimsValue(
-        user_id=data["sub"],
-        session_id=data["sid"],
+        user_id=UserIdValue(data["sub"]),
+        session_id=SessionIdValue(data["sid"]),
         email=data["email"],
         permissions=tuple(data.get("permissions", [])),
         issued_at=datetime.fromtimestamp(data["iat"], tz=UTC),
@@ -92,5 +111,25 @@ def Token(token_string: str, claims: TokenClaimsValue | None = None) -> TokenVal
     return TokenValue(value=token_string, claims=claims)
 
 
+def peek_expiry(token: TokenValue) -> float | None:
+    """Read the `exp` claim without verifying the signature.
+
+    Only good for rejecting tokens early: a returned expiry is untrusted and
+    None means the payload carries no readable expiry.
+    """
+    payload = token.value.split(".", 2)[1]
+    try:
+        data = orjson.loads(
+            base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4))
+        )
+    except (binascii.Error, ValueError):
+        return None
+
+    exp = data.get("exp") if type(data) is dict else None
+    if type(exp) is int or type(exp) is float:
+        return exp
+    return None
+
+
 # Add backward compatibility methods
 TokenClaimsValue.from_dict = staticmethod(TokenClaimsFromDict)
@@ -1,6 +1,7 @@
 """User ID value object - functional approach."""
 
 import uuid
+from functools import lru_cache
 from typing import NamedTuple
 
 
@@ -14,6 +15,9 @@ class UserIdValue(NamedTuple):
         return self.value
 
 
+# A user's id is re-wrapped on each of their logins and lookups, so repeats
+# skip the UUID parse; bounded to cap memory
+@lru_cache(maxsize=65_536)
 def UserId(user_id_string: str) -> UserIdValue:
     """Create and validate a user ID value object."""
     if not user_id_string:
@@ -28,9 +32,20 @@ def UserId(user_id_string: str) -> UserIdValue:
     return UserIdValue(value=user_id_string)
 
 
+def UserIdFromTrusted(user_id_string: str) -> UserIdValue:
+    """Create a user ID from an already-verified source, skipping validation.
+
+    Only for values that cannot be malformed, e.g. a `uuid` column read back
+    from the database.
+    """
+    return UserIdValue(user_id_string)
+
+
 def generate_user_id() -> UserIdValue:
     """Generate a new user ID."""
-    return UserId(str(uuid.uuid4()))
+    # Fresh uuid4 strings are valid and unique, so caching them would only
+    # evict ids that are looked up again
+    return UserIdValue(str(uuid.uuid4()))
 
 
 # For backwards compatibility, add generate method
@@ -0,0 +1,5 @@
+"""Cache coordination implementations."""
+
+from .redis_revocations import REVOCATION_CHANNEL, RedisRevocationChannel
+
+__all__ = ["REVOCATION_CHANNEL", "RedisRevocationChannel"]
@@ -0,0 +1,72 @@
+"""Cross-worker token cache invalidation over Redis pub/sub."""
+
+import asyncio
+import logging
+
+from redis.asyncio import Redis
+
+from heimdall.application.queries import TokenValidationCache
+from heimdall.domain.services import CacheInvalidator
+
+logger = logging.getLogger(__name__)
+
+REVOCATION_CHANNEL = "heimdall:revocations"
+
+
+class RedisRevocationChannel(CacheInvalidator):
+    """Broadcast session revocations and evict them from the local cache.
+
+    Every worker publishes revoked session IDs on a shared channel and runs a
+    listener that evicts those sessions from its own TokenValidationCache, so
+    a logout handled by one worker takes effect on all of them.
+    """
+
+    def __init__(
+        self,
+        client: Redis,
+        cache: TokenValidationCache,
+        channel: str = REVOCATION_CHANNEL,
+        retry_delay: float = 1.0,
+    ):
+        self._client = client
+        self._cache = cache
+        self._channel = channel
+        self._retry_delay = retry_delay
+        self._task: asyncio.Task[None] | None = None
+
+    async def publish(self, session_id: str) -> None:
+        """Announce a revoked session to every subscribed worker."""
+        await self._client.publish(self._channel, session_id)
+
+    def start(self) -> None:
+        """Start listening for revocations in the background."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        """Stop listening and close the Redis client."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await self._client.aclose()
+
+    async def _listen(self) -> None:
+        """Evict revoked sessions, resubscribing after connection errors."""
+        while True:
+            try:
+                async with self._client.pubsub() as pubsub:
+                    await pubsub.subscribe(self._channel)
+                    async for message in pubsub.listen():
+                        if message["type"] != "message":
+                            continue
+                        session_id = message["data"]
+                        if isinstance(session_id, bytes):
+                            session_id = session_id.decode()
+                        self._cache.evict_session(session_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # Entries still expire on their own TTL while disconnected
+                logger.exception("Revocation listener failed, resubscribing")
+                await asyncio.sleep(self._retry_delay)
@@ -0,0 +1,5 @@
+"""Messaging implementations."""
+
+from .queued_event_bus import QueuedEventBus
+
+__all__ = ["QueuedEventBus"]
@@ -0,0 +1,128 @@
+"""Event bus that decouples publishing from delivery via an in-process queue."""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+
+from heimdall.domain.events import DomainEventValue
+from heimdall.domain.services import EventBus
+
+logger = logging.getLogger(__name__)
+
+EventSink = Callable[[list[DomainEventValue]], Awaitable[None]]
+
+
+class QueuedEventBus(EventBus):
+    """Enqueue events on publish and deliver them to a sink in batches.
+
+    `publish` only touches the in-process queue, so command handlers never wait
+    on the downstream transport. A background task, started explicitly or on
+    the first publish, flushes up to `max_batch` events at a time, waiting at
+    most `max_delay` seconds to fill a batch.
+
+    The queue and task belong to the event loop that started them; starting
+    on a new loop (e.g. an app restart in the same process) rebinds the bus,
+    carrying over events still queued, and a flush task that has died is
+    restarted on the next publish.
+    """
+
+    def __init__(
+        self,
+        sink: EventSink,
+        max_batch: int = 100,
+        max_delay: float = 0.01,
+        maxsize: int = 10_000,
+    ):
+        self._sink = sink
+        self._max_batch = max_batch
+        self._max_delay = max_delay
+        self._maxsize = maxsize
+        self._queue: asyncio.Queue[DomainEventValue] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    async def publish(self, event: DomainEventValue) -> None:
+        """Enqueue an event; only waits when the queue is full."""
+        if self._task is None or self._task.done():
+            self.start()
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            await self._queue.put(event)
+
+    def start(self) -> None:
+        """Start the background flush task on the running loop."""
+        loop = asyncio.get_running_loop()
+        if self._task is not None and not self._task.done() and self._loop is loop:
+            return
+
+        if self._loop is not loop:
+            # asyncio queues bind to the first loop that waits on them
+            queue: asyncio.Queue[DomainEventValue] = asyncio.Queue(self._maxsize)
+            while self._queue is not None and not self._queue.empty():
+                queue.put_nowait(self._queue.get_nowait())
+            self._queue = queue
+            self._loop = loop
+
+        self._task = loop.create_task(self._run())
+        self._task.add_done_callback(self._on_task_done)
+
+    async def stop(self) -> None:
+        """Stop the flush task and deliver anything still queued."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+        while self._queue is not None and not self._queue.empty():
+            await self._flush(self._take_ready([]))
+
+    def _on_task_done(self, task: asyncio.Task[None]) -> None:
+        """Log a flush task that exited other than by cancellation."""
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(
+                "Event bus flush task died; restarting on next publish",
+                exc_info=task.exception(),
+            )
+
+    async def _run(self) -> None:
+        """Collect batches from the queue and flush them until cancelled."""
+        loop = asyncio.get_running_loop()
+        batch: list[DomainEventValue] = []
+        try:
+            while True:
+                batch = [await self._queue.get()]
+                deadline = loop.time() + self._max_delay
+
+                while len(batch) < self._max_batch:
+                    self._take_ready(batch)
+                    remaining = deadline - loop.time()
+                    if len(batch) >= self._max_batch or remaining <= 0:
+                        break
+                    try:
+                        batch.append(
+                            await asyncio.wait_for(self._queue.get(), remaining)
+                        )
+                    except TimeoutError:
+                        break
+
+                pending, batch = batch, []
+                await self._flush(pending)
+        except asyncio.CancelledError:
+            # Do not drop events already taken off the queue
+            if batch:
+                await self._flush(batch)
+            raise
+
+    def _take_ready(self, batch: list[DomainEventValue]) -> list[DomainEventValue]:
+        """Move already-queued events into the batch without waiting."""
+        while len(batch) < self._max_batch and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        return batch
+
+    async def _flush(self, batch: list[DomainEventValue]) -> None:
+        """Deliver a batch, logging rather than propagating sink failures."""
+        try:
+            await self._sink(batch)
+        except Exception:
+            logger.exception("Failed to deliver %d event(s)", len(batch))
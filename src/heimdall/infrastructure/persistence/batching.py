@@ -0,0 +1,101 @@
+"""Request coalescing for read-side session lookups."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+
+from heimdall.domain.entities import Session
+from heimdall.domain.repositories.read_repositories import ReadSessionRepository
+from heimdall.domain.value_objects import SessionId
+
+SessionBatchLoader = Callable[[list[SessionId]], Awaitable[dict[str, Session]]]
+
+
+class BatchingReadSessionRepository(ReadSessionRepository):
+    """Coalesce concurrent `find_by_id` calls into one batched lookup.
+
+    Lookups arriving within `window` seconds of each other (or until
+    `max_batch` distinct IDs are pending) are resolved by a single call to
+    `load_many`, e.g. a `WHERE id = ANY(...)` query. Concurrent lookups of the
+    same session share one result. Call `close` when the serving event loop
+    shuts down.
+    """
+
+    def __init__(
+        self,
+        load_many: SessionBatchLoader,
+        window: float = 0.002,
+        max_batch: int = 500,
+    ):
+        self._load_many = load_many
+        self._window = window
+        self._max_batch = max_batch
+        self._pending: dict[str, tuple[SessionId, asyncio.Future]] = {}
+        self._timer: asyncio.TimerHandle | None = None
+        self._inflight: set[asyncio.Task] = set()
+
+    async def find_by_id(self, session_id: SessionId) -> Session | None:
+        """Queue a lookup and wait for the batch that resolves it."""
+        key = session_id.value
+        pending = self._pending.get(key)
+        if pending is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending[key] = (session_id, future)
+            if len(self._pending) >= self._max_batch:
+                self._dispatch()
+            elif self._timer is None:
+                self._timer = loop.call_later(self._window, self._dispatch)
+        else:
+            future = pending[1]
+
+        # Shielded so one cancelled caller does not cancel the shared result
+        return await asyncio.shield(future)
+
+    async def close(self) -> None:
+        """Cancel queued and in-flight lookups; call before the loop shuts down.
+
+        Pending futures and the dispatch timer belong to the running loop, so
+        the repository must not outlive it.
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, {}
+        for _, future in batch.values():
+            future.cancel()
+
+        for task in self._inflight:
+            task.cancel()
+        await asyncio.gather(*self._inflight, return_exceptions=True)
+
+    def _dispatch(self) -> None:
+        """Hand the pending lookups to a background load."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, {}
+        task = asyncio.get_running_loop().create_task(self._load(batch))
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+
+    async def _load(self, batch: dict[str, tuple[SessionId, asyncio.Future]]) -> None:
+        """Run one batched lookup and resolve every waiting caller."""
+        try:
+            sessions = await self._load_many([sid for sid, _ in batch.values()])
+        except Exception as e:
+            for _, future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+        except BaseException:
+            # Cancelled (e.g. at shutdown): release the shielded waiters rather
+            # than leave them awaiting a result that will never come
+            for _, future in batch.values():
+                future.cancel()
+            raise
+
+        for key, (_, future) in batch.items():
+            if not future.done():
+                future.set_result(sessions.get(key))
@@ -0,0 +1,162 @@
+"""In-process caching for write-side user lookups."""
+
+import time
+from collections import OrderedDict
+from collections.abc import Iterable, Sequence
+
+from heimdall.domain.entities import User
+from heimdall.domain.repositories.write_repositories import WriteUserRepository
+from heimdall.domain.value_objects import Email, UserId
+
+
+def _copy_user(user: User) -> User:
+    """Detached copy of a user, so callers never share a cached instance."""
+    return User(
+        user.id,
+        user.email,
+        user.password_hash,
+        user.is_active,
+        user.is_verified,
+        set(user.permissions),
+        user.created_at,
+        user.updated_at,
+        user.last_login_at,
+    )
+
+
+class CachingUserRepository(WriteUserRepository):
+    """Short-lived LRU cache in front of `find_by_email`.
+
+    Absorbs bursts of logins for the same email (retries, credential
+    stuffing) without a database round-trip each. Only found users are
+    cached; entries expire after `ttl` seconds and are dropped whenever
+    this process saves or creates the user, so the TTL only bounds
+    staleness from writes made by other workers.
+
+    Every caller gets its own copy of a cached user, since commands mutate
+    the entity (e.g. `authenticate` on the password-hashing pool). A load
+    that overlaps an invalidation of the same email is returned but not
+    cached, so a read racing a save cannot put the old user back.
+    """
+
+    def __init__(
+        self,
+        inner: WriteUserRepository,
+        maxsize: int = 10_000,
+        ttl: float = 30.0,
+    ):
+        self._inner = inner
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, User]] = OrderedDict()
+        # Per-email invalidation counts, kept only while a load is in flight
+        self._loading: dict[str, int] = {}
+        self._generations: dict[str, int] = {}
+
+    async def find_by_email(self, email: Email) -> User | None:
+        """Find user by email, serving recent lookups from memory."""
+        key = email.value
+        entry = self._entries.get(key)
+        if entry is not None:
+            deadline, user = entry
+            if time.monotonic() < deadline:
+                self._entries.move_to_end(key)
+                return _copy_user(user)
+            del self._entries[key]
+
+        started = self._begin_load((key,))
+        try:
+            user = await self._inner.find_by_email(email)
+        finally:
+            fresh = self._end_load(started)
+        if user is not None and key in fresh:
+            self._store(key, _copy_user(user))
+        return user
+
+    async def exists_by_email(self, email: Email) -> bool:
+        """Check if user exists by email."""
+        return await self._inner.exists_by_email(email)
+
+    async def save(self, user: User) -> None:
+        """Save user, then drop its cached copy."""
+        await self._inner.save(user)
+        self.invalidate(user.email)
+
+    async def create_if_not_exists(self, user: User) -> bool:
+        """Insert a new user unless the email is taken."""
+        created = await self._inner.create_if_not_exists(user)
+        if created:
+            self.invalidate(user.email)
+        return created
+
+    async def find_by_id(self, user_id: UserId) -> User | None:
+        """Find user by ID."""
+        return await self._inner.find_by_id(user_id)
+
+    async def find_by_ids(self, user_ids: Sequence[UserId]) -> dict[str, User]:
+        """Find many users by ID, keyed by ID."""
+        return await self._inner.find_by_ids(user_ids)
+
+    async def find_by_emails(self, emails: Sequence[Email]) -> dict[str, User]:
+        """Find many users by email, loading only uncached ones in one batch."""
+        found: dict[str, User] = {}
+        missing: list[Email] = []
+        now = time.monotonic()
+        for email in emails:
+            entry = self._entries.get(email.value)
+            if entry is not None and now < entry[0]:
+                found[email.value] = _copy_user(entry[1])
+            else:
+                missing.append(email)
+
+        if missing:
+            started = self._begin_load([email.value for email in missing])
+            try:
+                loaded = await self._inner.find_by_emails(missing)
+            finally:
+                fresh = self._end_load(started)
+            for key, user in loaded.items():
+                if key in fresh:
+                    self._store(key, _copy_user(user))
+            found.update(loaded)
+        return found
+
+    def _begin_load(self, keys: Iterable[str]) -> dict[str, int]:
+        """Mark loads in flight and snapshot each key's invalidation count."""
+        started = {}
+        for key in keys:
+            self._loading[key] = self._loading.get(key, 0) + 1
+            started[key] = self._generations.get(key, 0)
+        return started
+
+    def _end_load(self, started: dict[str, int]) -> set[str]:
+        """Finish loads and return the keys not invalidated meanwhile."""
+        fresh = set()
+        for key, generation in started.items():
+            if self._generations.get(key, 0) == generation:
+                fresh.add(key)
+            remaining = self._loading[key] - 1
+            if remaining:
+                self._loading[key] = remaining
+            else:
+                del self._loading[key]
+                self._generations.pop(key, None)
+        return fresh
+
+    def _store(self, key: str, user: User) -> None:
+        """Cache a user under its email, evicting the oldest entry when full."""
+        self._entries[key] = (time.monotonic() + self.ttl, user)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, email: Email) -> None:
+        """Drop the cached user for an email if present."""
+        key = email.value
+        self._entries.pop(key, None)
+        if key in self._loading:
+            self._generations[key] = self._generations.get(key, 0) + 1
+
+    def __len__(self) -> int:
+        """Number of cached entries (including not-yet-evicted expired ones)."""
+        return len(self._entries)
@@ -1,17 +1,42 @@
 """PostgreSQL database connection and configuration."""
 
 import os
-from contextlib import asynccontextmanager
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
 
 from asyncpg import Pool, create_pool
+from asyncpg.pool import PoolAcquireContext
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class DatabaseConfig:
     """Immutable database configuration."""
 
     database_url: str
+    pool_min_size: int = 10
+    pool_max_size: int = 50
+    # Optional read replica for the query side; reads use the primary when unset
+    read_url: str | None = None
+    write_pool_min_size: int = 2
+    write_pool_max_size: int = 10
+    pool_acquire_timeout: float = 30.0
+    # asyncpg prepares every fetch/execute and keeps the plan in a
+    # per-connection LRU keyed by SQL text; size it to hold all repository SQL
+    statement_cache_size: int = 1024
+    # Recycle idle or long-lived connections before the server or a proxy
+    # drops them from under the pool
+    pool_max_inactive_lifetime: float = 300.0
+    pool_max_queries: int = 50_000
+
+
+_SQLALCHEMY_SCHEME = "postgresql+asyncpg://"
+
+
+def _asyncpg_dsn(url: str) -> str:
+    """Strip the SQLAlchemy-style +asyncpg driver suffix asyncpg rejects."""
+    if url.startswith(_SQLALCHEMY_SCHEME):
+        return "postgresql://" + url[len(_SQLALCHEMY_SCHEME) :]
+    return url
 
 
 def create_database_config() -> DatabaseConfig:
@@ -26,45 +51,116 @@ def create_database_config() -> DatabaseConfig:
     )
 
     # Remove the +asyncpg part if present
-    if "+asyncpg" in database_url:
-        database_url = database_url.replace("postgresql+asyncpg://", "postgresql://")
-
-    return DatabaseConfig(database_url=database_url)
+    database_url = _asyncpg_dsn(database_url)
+    read_url = os.getenv("DATABASE_READ_URL")
+
+    return DatabaseConfig(
+        database_url=database_url,
+        pool_min_size=int(os.getenv("DB_POOL_MIN_SIZE", "10")),
+        pool_max_size=int(os.getenv("DB_POOL_MAX_SIZE", "50")),
+        read_url=_asyncpg_dsn(read_url) if read_url else None,
+        write_pool_min_size=int(os.getenv("DB_WRITE_POOL_MIN_SIZE", "2")),
+        write_pool_max_size=int(os.getenv("DB_WRITE_POOL_MAX_SIZE", "10")),
+        pool_acquire_timeout=float(os.getenv("DB_POOL_TIMEOUT", "30")),
+        statement_cache_size=int(os.getenv("DB_STATEMENT_CACHE_SIZE", "1024")),
+        pool_max_inactive_lifetime=float(
+            os.getenv("DB_POOL_MAX_INACTIVE_LIFETIME", "300")
+        ),
+        pool_max_queries=int(os.getenv("DB_POOL_MAX_QUERIES", "50000")),
+    )
 
 
 class DatabaseManager:
-    """Database connection pool manager."""
+    """Database connection pool manager.
+
+    Commands use the primary pool. With a read replica configured, queries
+    get their own pool against it and may lag the primary slightly (eventual
+    consistency); otherwise both sides share the primary pool.
+    """
 
     def __init__(self, config: DatabaseConfig):
         self.config = config
         self._pool: Pool | None = None
+        self._read_pool: Pool | None = None
 
     async def initialize(self):
-        """Initialize database connection pool."""
-        self._pool = await create_pool(
-            self.config.database_url,
-            min_size=1,
-            max_size=10,
+        """Initialize database connection pools."""
+        config = self.config
+        if config.read_url is None:
+            self._pool = await self._create_pool(
+                config.database_url, config.pool_min_size, config.pool_max_size
+            )
+            self._read_pool = self._pool
+            return
+
+        self._pool = await self._create_pool(
+            config.database_url,
+            config.write_pool_min_size,
+            config.write_pool_max_size,
+        )
+        self._read_pool = await self._create_pool(
+            config.read_url, config.pool_min_size, config.pool_max_size
+        )
+
+    async def _create_pool(self, dsn: str, min_size: int, max_size: int) -> Pool:
+        """Create a connection pool with the shared settings.
+
+        asyncpg opens `min_size` connections concurrently before returning,
+        so the pool is already warm when the first request arrives.
+        """
+        return await create_pool(
+            dsn,
+            min_size=min_size,
+            max_size=max_size,
+            max_inactive_connection_lifetime=self.config.pool_max_inactive_lifetime,
+            max_queries=self.config.pool_max_queries,
             command_timeout=60,
+            statement_cache_size=self.config.statement_cache_size,
+            # Repository SQL is static, so cached plans never need expiring
+            max_cached_statement_lifetime=0,
             server_settings={
                 "jit": "off"  # Disable JIT compilation for simpler deployment
             },
         )
 
     async def close(self):
-        """Close database connection pool."""
+        """Close database connection pools."""
+        if self._read_pool is not None and self._read_pool is not self._pool:
+            await self._read_pool.close()
         if self._pool:
             await self._pool.close()
+        self._pool = self._read_pool = None
+
+    def get_connection(self) -> PoolAcquireContext:
+        """Get a connection to the primary database.
+
+        Returns asyncpg's own acquire context manager, so `async with` costs
+        no extra generator frame per query.
+        """
+        return self._primary().acquire(timeout=self.config.pool_acquire_timeout)
+
+    # Commands always write to the primary
+    get_write_connection = get_connection
+
+    def get_read_connection(self) -> PoolAcquireContext:
+        """Get a connection for read-only queries (replica when configured)."""
+        return self._replica().acquire(timeout=self.config.pool_acquire_timeout)
 
-    @asynccontextmanager
-    async def get_connection(self):
-        """Get a database connection from the pool."""
+    def _primary(self) -> Pool:
+        """Return the primary pool, failing fast before initialization."""
         if not self._pool:
             raise RuntimeError("Database not initialized")
+        return self._pool
 
-        async with self._pool.acquire() as connection:
-            yield connection
+    def _replica(self) -> Pool:
+        """Return the read pool, failing fast before initialization."""
+        if not self._read_pool:
+            raise RuntimeError("Database not initialized")
+        return self._read_pool
 
+    # Single-statement helpers acquire through the context managers above so
+    # an exhausted pool fails after pool_acquire_timeout instead of waiting
+    # forever; use those directly for multi-statement work and transactions
     async def execute_query(self, query: str, *args):
         """Execute a query and return results."""
         async with self.get_connection() as conn:
@@ -75,42 +171,48 @@ class DatabaseManager:
         async with self.get_connection() as conn:
             return await conn.execute(query, *args)
 
+    async def fetchrow(self, query: str, *args):
+        """Run a query on the primary and return the first row, if any."""
+        async with self.get_connection() as conn:
+            return await conn.fetchrow(query, *args)
 
-class _DatabaseManagerSingleton:
-    """Singleton for database manager."""
+    async def fetchval(self, query: str, *args):
+        """Run a query on the primary and return the first column of the first row."""
+        async with self.get_connection() as conn:
+            return await conn.fetchval(query, *args)
 
-    def __init__(self):
-        self._instance: DatabaseManager | None = None
+    async def execute_many(self, query: str, args: Iterable[Sequence]) -> None:
+        """Execute a command once per argument tuple in a single round-trip."""
+        async with self.get_connection() as conn:
+            await conn.executemany(query, args)
 
-    def get_manager(self) -> DatabaseManager:
-        """Get or create the database manager."""
-        if self._instance is None:
-            config = create_database_config()
-            self._instance = DatabaseManager(config)
-        return self._instance
+    async def fetch_read(self, query: str, *args):
+        """Run a read-only query and return all rows."""
+        async with self.get_read_connection() as conn:
+            return await conn.fetch(query, *args)
 
-    async def close_manager(self):
-        """Close the database manager."""
-        if self._instance:
-            await self._instance.close()
-            self._instance = None
+    async def fetchrow_read(self, query: str, *args):
+        """Run a read-only query and return the first row, if any."""
+        async with self.get_read_connection() as conn:
+            return await conn.fetchrow(query, *args)
 
 
-# Module-level singleton instance
-_db_singleton = _DatabaseManagerSingleton()
+# Resolved once at import; dependency lookups return it without indirection
+DB_MANAGER = DatabaseManager(create_database_config())
 
 
 def get_database_manager() -> DatabaseManager:
-    """Get or create the global database manager."""
-    return _db_singleton.get_manager()
+    """Get the global database manager."""
+    return DB_MANAGER
 
 
 async def initialize_database():
     """Initialize the database connection pool."""
-    db_manager = get_database_manager()
-    await db_manager.initialize()
+    # Re-read the environment so settings applied after import still count
+    DB_MANAGER.config = create_database_config()
+    await DB_MANAGER.initialize()
 
 
 async def close_database():
     """Close the database connection pool."""
-    await _db_singleton.close_manager()
+    await DB_MANAGER.close()
@@ -1,16 +1,20 @@
 """PostgreSQL-based dependency injection for FastAPI."""
 
-import logging
+import uuid
 from functools import lru_cache
-from unittest.mock import AsyncMock, Mock
 
-from fastapi import Depends
+from redis.asyncio import Redis
 
 from heimdall.application.commands import CommandDependencies
-from heimdall.application.queries import QueryDependencies
+from heimdall.application.queries import QueryDependencies, TokenValidationCache
+from heimdall.domain.events import DomainEventValue
+from heimdall.domain.services import CacheInvalidator, EventBus
 from heimdall.domain.value_objects import Token, TokenClaims
 
-from .database import DatabaseManager, get_database_manager
+from ..batching import BatchingReadSessionRepository
+from ..caching import CachingUserRepository
+from ..redis import RedisReadSessionRepository, RedisWriteSessionRepository
+from .database import DB_MANAGER, DatabaseManager
 from .session_repository import (
     PostgreSQLReadSessionRepository,
     PostgreSQLWriteSessionRepository,
@@ -18,131 +22,160 @@ from .session_repository import (
 from .user_repository import PostgreSQLUserRepository
 
 
-@lru_cache
 def get_db_manager() -> DatabaseManager:
     """Get database manager singleton."""
-    return get_database_manager()
+    return DB_MANAGER
 
 
-def get_postgresql_user_repository() -> PostgreSQLUserRepository:
-    """Get PostgreSQL user repository."""
-    return PostgreSQLUserRepository(get_db_manager())
+@lru_cache
+def get_postgresql_user_repository() -> CachingUserRepository:
+    """Get shared PostgreSQL user repository with cached email lookups."""
+    return CachingUserRepository(PostgreSQLUserRepository(DB_MANAGER))
 
 
+@lru_cache
 def get_postgresql_write_session_repository() -> PostgreSQLWriteSessionRepository:
-    """Get PostgreSQL write session repository."""
-    return PostgreSQLWriteSessionRepository(get_db_manager())
+    """Get shared PostgreSQL write session repository."""
+    return PostgreSQLWriteSessionRepository(DB_MANAGER)
+
+
+@lru_cache
+def get_postgresql_read_session_repository() -> BatchingReadSessionRepository:
+    """Get shared read session repository that batches concurrent lookups."""
+    return BatchingReadSessionRepository(
+        PostgreSQLReadSessionRepository(DB_MANAGER).find_by_ids
+    )
+
 
+@lru_cache(maxsize=1)
+def get_redis_read_session_repository(client: Redis) -> RedisReadSessionRepository:
+    """Get shared read session repository that serves hits from Redis."""
+    return RedisReadSessionRepository(client, get_postgresql_read_session_repository())
 
-def get_postgresql_read_session_repository() -> PostgreSQLReadSessionRepository:
-    """Get PostgreSQL read session repository."""
-    return PostgreSQLReadSessionRepository(get_db_manager())
+
+@lru_cache(maxsize=1)
+def get_redis_write_session_repository(client: Redis) -> RedisWriteSessionRepository:
+    """Get shared write session repository that invalidates Redis on save."""
+    return RedisWriteSessionRepository(
+        client, get_postgresql_write_session_repository()
+    )
 
 
-class _TokenServiceSingleton:
-    """Singleton for token service."""
+async def close_postgresql_dependencies() -> None:
+    """Release loop-bound repositories so a restarted app builds fresh ones."""
+    if get_postgresql_read_session_repository.cache_info().currsize:
+        await get_postgresql_read_session_repository().close()
 
-    def __init__(self):
-        self._instance = None
+    get_postgresql_read_session_repository.cache_clear()
+    get_redis_read_session_repository.cache_clear()
+    get_postgresql_query_dependencies.cache_clear()
 
-    def get_service(self):
-        """Get or create the token service."""
-        if self._instance is None:
-            self._create_service()
-        return self._instance
 
-    def _create_service(self):
-        """Create the token service instance."""
-        self._instance = Mock()
-        self._setup_mock_methods()
+def _is_uuid(value: str) -> bool:
+    """Check whether a string is a valid UUID."""
+    try:
+        uuid.UUID(value)
+    except ValueError:
+        return False
+    return True
 
-    def _setup_mock_methods(self):
-        """Set up mock methods for token service."""
 
-        def generate_token_impl(session):
-            # Create a unique token value for this session (JWT format: 3 parts)
-            token_value = (
-                f"eyJ{session.id}.eyJ0eXAiOiJKV1QiLCJhbGciOiJIUzI1NiJ9."
-                f"{session.id}signature"
-            )
-            return Token(token_value)
+_JWT_HEADER = "eyJ0eXAiOiJKV1QiLCJhbGciOiJIUzI1NiJ9"
 
-        def validate_token_impl(token):
-            # Extract session ID and user info from token (simplified JWT decoding)
-            # In real implementation, this would properly decode and validate JWT
-            parts = token.value.split(".")
-            if len(parts) >= 2:
-                try:
-                    # Extract session ID from first part (header contains session ID)
-                    session_id = parts[0].replace("eyJ", "")
 
-                    # For this demo, we extract basic claims from the token structure
-                    # In a real JWT implementation, this would decode the payload
-                    return TokenClaims(
-                        user_id="",  # Will be filled by the query handler from session
-                        session_id=session_id,
-                        email="",  # Will be filled by the query handler from session
-                        permissions=[],
-                    )
+class _TokenService:
+    """Demo token service that embeds the session ID in the token."""
 
-                except Exception as e:
-                    # Log the exception instead of silent pass
-                    logging.warning(f"Token validation failed: {e}")
-                    raise ValueError(f"Token validation failed: {e}") from e
-            raise ValueError("Invalid token format")
+    def generate_token(self, session):
+        """Create a unique token value for this session (JWT format: 3 parts)."""
+        session_id = session.id.value
+        return Token(f"eyJ{session_id}.{_JWT_HEADER}.{session_id}signature")
 
-        self._instance.generate_token = generate_token_impl
-        self._instance.validate_token = validate_token_impl
+    def validate_token(self, token):
+        """Extract the session ID from the token (simplified JWT decoding).
 
+        In a real JWT implementation, this would verify and decode the payload.
+        """
+        head, sep, _ = token.value.partition(".")
+        if not sep:
+            return None
 
-# Module-level singleton for token service
-_token_singleton = _TokenServiceSingleton()
+        # Claims are trusted downstream, so non-UUID ids are unknown
+        session_id = head.removeprefix("eyJ")
+        if not _is_uuid(session_id):
+            return None
+
+        return TokenClaims(
+            user_id="",  # Will be filled by the query handler from session
+            session_id=session_id,
+            email="",  # Will be filled by the query handler from session
+        )
+
+
+# Module-level token service; stateless, so one instance serves every request
+_TOKEN_SERVICE = _TokenService()
+
+# Shared across requests so repeated validations of a token hit the cache
+_token_validation_cache = TokenValidationCache()
 
 
 def get_token_service():
-    """Get or create the PostgreSQL token service singleton."""
-    return _token_singleton.get_service()
+    """Get the shared PostgreSQL token service."""
+    return _TOKEN_SERVICE
 
 
-def get_event_bus():
-    """Get mock event bus instance."""
-    event_bus = AsyncMock()
+class _NoopEventBus(EventBus):
+    """Event bus that drops events until a message queue is wired in."""
 
-    async def publish_impl(event):
-        # For now, just log or ignore events
-        # In real implementation, this would publish to message queue
-        pass
+    async def publish(self, event: DomainEventValue) -> None:
+        """Discard the event."""
+        return None
 
-    event_bus.publish = publish_impl
-    return event_bus
 
+_EVENT_BUS = _NoopEventBus()
 
-# Create module-level Depends objects to avoid B008 warnings
-_DB_MANAGER_DEPENDENCY = Depends(get_db_manager)
-_USER_REPO_DEPENDENCY = Depends(lambda: get_postgresql_user_repository())
-_WRITE_SESSION_REPO_DEPENDENCY = Depends(
-    lambda: get_postgresql_write_session_repository()
-)
-_READ_SESSION_REPO_DEPENDENCY = Depends(
-    lambda: get_postgresql_read_session_repository()
-)
-_TOKEN_SERVICE_DEPENDENCY = Depends(get_token_service)
-_EVENT_BUS_DEPENDENCY = Depends(get_event_bus)
 
+def get_event_bus():
+    """Get the shared no-op event bus."""
+    return _EVENT_BUS
+
+
+# Every argument is a process-wide singleton, so the frozen result is shared
+@lru_cache(maxsize=4)
+def get_postgresql_command_dependencies(
+    token_cache: TokenValidationCache | None = None,
+    cache_invalidator: CacheInvalidator | None = None,
+    redis_client: Redis | None = None,
+) -> CommandDependencies:
+    """Get shared command dependencies with PostgreSQL repositories."""
+    if redis_client is not None:
+        session_repository = get_redis_write_session_repository(redis_client)
+    else:
+        session_repository = get_postgresql_write_session_repository()
 
-def get_postgresql_command_dependencies() -> CommandDependencies:
-    """Create command dependencies with PostgreSQL repositories."""
     return CommandDependencies(
         user_repository=get_postgresql_user_repository(),
-        session_repository=get_postgresql_write_session_repository(),
+        session_repository=session_repository,
         token_service=get_token_service(),
         event_bus=get_event_bus(),
+        token_cache=_token_validation_cache if token_cache is None else token_cache,
+        cache_invalidator=cache_invalidator,
     )
 
 
-def get_postgresql_query_dependencies() -> QueryDependencies:
-    """Create query dependencies with PostgreSQL repositories."""
+@lru_cache(maxsize=4)
+def get_postgresql_query_dependencies(
+    token_cache: TokenValidationCache | None = None,
+    redis_client: Redis | None = None,
+) -> QueryDependencies:
+    """Get shared query dependencies with PostgreSQL repositories."""
+    if redis_client is not None:
+        session_repository = get_redis_read_session_repository(redis_client)
+    else:
+        session_repository = get_postgresql_read_session_repository()
+
     return QueryDependencies(
-        session_repository=get_postgresql_read_session_repository(),
+        session_repository=session_repository,
         token_service=get_token_service(),
+        token_cache=_token_validation_cache if token_cache is None else token_cache,
     )
@@ -0,0 +1,85 @@
+"""PostgreSQL implementation of the event repository."""
+
+from collections.abc import Sequence
+from datetime import datetime
+
+import orjson
+
+from heimdall.domain.events import DomainEventValue
+from heimdall.domain.repositories.event_repository import EventRepository
+
+from .database import DatabaseManager
+
+INSERT_EVENT_SQL = """
+INSERT INTO audit_events (id, event_type, user_id, event_data, created_at)
+VALUES ($1, $2, $3, $4::jsonb, $5)
+"""
+
+_SELECT_EVENTS = """
+SELECT id, event_type, created_at, event_data
+FROM audit_events
+"""
+
+
+def _event_to_record(event: DomainEventValue) -> tuple:
+    """Build the INSERT arguments for one event."""
+    event_id, event_type, occurred_at, data = event
+    return (
+        event_id,
+        event_type,
+        data.get("user_id"),
+        orjson.dumps(data).decode(),
+        occurred_at,
+    )
+
+
+def _row_to_event(row) -> DomainEventValue:
+    """Rebuild a domain event from an audit_events row."""
+    event_id, event_type, created_at, event_data = row
+    return DomainEventValue(
+        str(event_id),
+        event_type,
+        created_at,
+        orjson.loads(event_data) if event_data is not None else {},
+    )
+
+
+class PostgreSQLEventRepository(EventRepository):
+    """Append-only event store backed by the `audit_events` table.
+
+    `save_many` writes a whole batch with one `executemany` round-trip, so it
+    can be used directly as a `QueuedEventBus` sink.
+    """
+
+    def __init__(self, db_manager: DatabaseManager):
+        self.db_manager = db_manager
+
+    async def save(self, event: DomainEventValue) -> None:
+        """Save a domain event."""
+        await self.save_many((event,))
+
+    async def save_many(self, events: Sequence[DomainEventValue]) -> None:
+        """Save a batch of domain events in a single round-trip."""
+        if events:
+            await self.db_manager.execute_many(
+                INSERT_EVENT_SQL, [_event_to_record(event) for event in events]
+            )
+
+    async def find_by_aggregate_id(self, aggregate_id: str) -> list[DomainEventValue]:
+        """Find all events for a user, oldest first."""
+        rows = await self.db_manager.fetch_read(
+            _SELECT_EVENTS + "WHERE user_id = $1 ORDER BY created_at", aggregate_id
+        )
+        return [_row_to_event(row) for row in rows]
+
+    async def find_by_time_range(
+        self, start_time: datetime, end_time: datetime
+    ) -> list[DomainEventValue]:
+        """Find events within a time range, oldest first."""
+        rows = await self.db_manager.fetch_read(
+            _SELECT_EVENTS
+            + "WHERE created_at >= $1 AND created_at < $2 ORDER BY created_at",
+            start_time,
+            end_time,
+        )
+        return [_row_to_event(row) for row in rows]
@@ -4,58 +4,110 @@ These are functional components that handle the transformation between
 database schema and domain objects without side effects.
 """
 
+from collections.abc import Sequence
 from typing import Any
 
 from heimdall.domain.entities import Session, User
-from heimdall.domain.value_objects import Email, SessionId, UserId
+from heimdall.domain.value_objects import (
+    Email,
+    SessionIdFromTrusted,
+    UserIdFromTrusted,
+)
 from heimdall.domain.value_objects.password import PasswordHashValue
 
-
-def row_to_user(row: dict[str, Any]) -> User:
+# Column order each row mapper unpacks; repository SELECTs must match it
+USER_COLUMNS = (
+    "id",
+    "email",
+    "password_hash",
+    "status",
+    "is_verified",
+    "created_at",
+    "updated_at",
+    "last_login_at",
+)
+SESSION_COLUMNS = ("id", "user_id", "created_at", "expires_at", "status", "email")
+ACTIVE_SESSION_COLUMNS = ("id", "user_id", "created_at", "expires_at", "email")
+
+
+def row_to_user(row: Sequence[Any]) -> User:
     """Pure function to convert database row to User entity.
 
     Args:
-        row: Database row with user data
+        row: Database row with user data, in `USER_COLUMNS` order
 
     Returns:
         User domain entity
     """
-    # Map database schema to domain entity
-    is_active = row["status"] == "active"
+    # Positional unpacking skips a key lookup per field; id columns are typed
+    # uuid, so they are wrapped without re-validating the format
+    (
+        user_id,
+        email,
+        password_hash,
+        status,
+        is_verified,
+        created_at,
+        updated_at,
+        last_login_at,
+    ) = row
     return User(
-        id=UserId(str(row["id"])),
-        email=Email(row["email"]),
-        password_hash=PasswordHashValue(row["password_hash"]),
-        is_active=is_active,
-        is_verified=row["is_verified"],
-        created_at=row["created_at"],
-        updated_at=row["updated_at"],
-        last_login_at=row["last_login_at"],
+        id=UserIdFromTrusted(str(user_id)),
+        email=Email(email),
+        password_hash=PasswordHashValue(password_hash),
+        is_active=status == "active",
+        is_verified=is_verified,
+        created_at=created_at,
+        updated_at=updated_at,
+        last_login_at=last_login_at,
     )
 
 
-def row_to_session(row: dict[str, Any]) -> Session:
+def row_to_session(row: Sequence[Any]) -> Session:
     """Pure function to convert database row to Session entity.
 
     Args:
-        row: Database row with session data
+        row: Database row with session data, in `SESSION_COLUMNS` order
 
     Returns:
         Session domain entity
     """
-    # Map database schema to domain entity
-    is_active = row["status"] == "active"
+    session_id, user_id, created_at, expires_at, status, email = row
 
-    # For now, we'll use empty permissions list - in real implementation,
+    # For now, we'll use empty permissions - in real implementation,
     # you'd probably join with user_permissions or role_permissions tables
     return Session(
-        id=SessionId(str(row["id"])),
-        user_id=UserId(str(row["user_id"])),
-        email=Email(row["email"]),
-        permissions=[],  # TODO: Load from user_permissions/role_permissions
-        created_at=row["created_at"],
-        expires_at=row["expires_at"],
-        is_active=is_active,
+        id=SessionIdFromTrusted(str(session_id)),
+        user_id=UserIdFromTrusted(str(user_id)),
+        email=Email(email),
+        permissions=(),  # TODO: Load from user_permissions/role_permissions
+        created_at=created_at,
+        expires_at=expires_at,
+        is_active=status == "active",
+    )
+
+
+def row_to_active_session(row: Sequence[Any]) -> Session:
+    """Pure function to convert a row from an active-only query to a Session.
+
+    Validity is decided by the query's WHERE clause, so the row carries no
+    status column and the session is built as active directly.
+
+    Args:
+        row: Database row with session data, in `ACTIVE_SESSION_COLUMNS` order
+
+    Returns:
+        Active Session domain entity
+    """
+    session_id, user_id, created_at, expires_at, email = row
+    return Session(
+        id=SessionIdFromTrusted(str(session_id)),
+        user_id=UserIdFromTrusted(str(user_id)),
+        email=Email(email),
+        permissions=(),
+        created_at=created_at,
+        expires_at=expires_at,
+        is_active=True,
     )
 
 
@@ -69,8 +121,8 @@ def user_to_db_params(user: User) -> dict[str, Any]:
         Dictionary with database parameters
     """
     return {
-        "id": str(user.id),
-        "email": str(user.email),
+        "id": user.id.value,
+        "email": user.email.value,
         "password_hash": user.password_hash.value,
         "status": "active" if user.is_active else "inactive",
         "is_verified": user.is_verified,
@@ -91,11 +143,14 @@ def session_to_db_params(session: Session) -> dict[str, Any]:
     """
     # Generate a simple token hash for the session
     # (in real implementation, this would be the JWT hash)
-    token_hash = f"hash_{session.id}_{session.user_id}"
+    session_id = session.id.value
+    user_id = session.user_id.value
+    token_hash = f"hash_{session_id}_{user_id}"
 
     return {
-        "id": str(session.id),
-        "user_id": str(session.user_id),
+        "id": session_id,
+        "user_id": user_id,
+        "email": session.email.value,
         "status": "active" if session.is_active else "invalidated",
         "created_at": session.created_at,
         "expires_at": session.expires_at,
@@ -1,6 +1,6 @@
 """PostgreSQL implementation of session repositories."""
 
-import uuid
+from collections.abc import Sequence
 
 from heimdall.domain.entities import Session
 from heimdall.domain.repositories.read_repositories import ReadSessionRepository
@@ -8,7 +8,66 @@ from heimdall.domain.repositories.write_repositories import WriteSessionReposito
 from heimdall.domain.value_objects import SessionId
 
 from .database import DatabaseManager
-from .mappers import row_to_session, session_to_db_params
+from .mappers import (
+    ACTIVE_SESSION_COLUMNS,
+    SESSION_COLUMNS,
+    row_to_active_session,
+    row_to_session,
+    session_to_db_params,
+)
+
+# Built from the mapper column tuples so selected order always matches the
+# positional unpacking in row_to_session / row_to_active_session
+_FIND_BY_ID_SQL = (
+    "SELECT " + ", ".join(SESSION_COLUMNS) + "\nFROM sessions\nWHERE id = $1"
+)
+
+_FIND_ACTIVE_BY_ID_SQL = (
+    "SELECT "
+    + ", ".join(ACTIVE_SESSION_COLUMNS)
+    + """
+FROM sessions
+WHERE id = $1
+    AND status = 'active'
+    AND expires_at > CURRENT_TIMESTAMP
+"""
+)
+
+_FIND_ACTIVE_BY_IDS_SQL = (
+    "SELECT "
+    + ", ".join(ACTIVE_SESSION_COLUMNS)
+    + """
+FROM sessions
+WHERE id = ANY($1::uuid[])
+    AND status = 'active'
+    AND expires_at > CURRENT_TIMESTAMP
+"""
+)
+
+_COPY_COLUMNS = (
+    "id",
+    "user_id",
+    "created_at",
+    "expires_at",
+    "status",
+    "token_hash",
+    "email",
+)
+
+# Temp tables are per connection; rows are cleared when the transaction ends
+_CREATE_STAGING_SQL = """
+CREATE TEMP TABLE IF NOT EXISTS sessions_staging
+    (LIKE sessions INCLUDING DEFAULTS) ON COMMIT DELETE ROWS
+"""
+
+_UPSERT_FROM_STAGING_SQL = """
+INSERT INTO sessions (id, user_id, created_at, expires_at, status, token_hash, email)
+SELECT id, user_id, created_at, expires_at, status, token_hash, email
+FROM sessions_staging
+ON CONFLICT (id) DO UPDATE SET
+    status = EXCLUDED.status,
+    expires_at = EXCLUDED.expires_at
+"""
 
 
 class PostgreSQLWriteSessionRepository(WriteSessionRepository):
@@ -19,16 +78,7 @@ class PostgreSQLWriteSessionRepository(WriteSessionRepository):
 
     async def find_by_id(self, session_id: SessionId) -> Session | None:
         """Find session by ID for commands."""
-        query = """
-        SELECT s.id, s.user_id, s.created_at, s.expires_at,
-               s.status, u.email
-        FROM sessions s
-        JOIN users u ON s.user_id = u.id
-        WHERE s.id = $1
-        """
-
-        async with self.db_manager.get_connection() as conn:
-            row = await conn.fetchrow(query, uuid.UUID(str(session_id)))
+        row = await self.db_manager.fetchrow(_FIND_BY_ID_SQL, session_id.value)
 
         if not row:
             return None
@@ -40,8 +90,9 @@ class PostgreSQLWriteSessionRepository(WriteSessionRepository):
         # For simplicity, we'll always insert new sessions
         # In a real system, you might want to handle updates as well
         insert_query = """
-        INSERT INTO sessions (id, user_id, created_at, expires_at, status, token_hash)
-        VALUES ($1, $2, $3, $4, $5, $6)
+        INSERT INTO sessions (id, user_id, created_at, expires_at, status, token_hash,
+                              email)
+        VALUES ($1, $2, $3, $4, $5, $6, $7)
         ON CONFLICT (id) DO UPDATE SET
             status = EXCLUDED.status,
             expires_at = EXCLUDED.expires_at
@@ -50,51 +101,70 @@ class PostgreSQLWriteSessionRepository(WriteSessionRepository):
         # Use pure function to get database parameters
         db_params = session_to_db_params(session)
 
-        async with self.db_manager.get_connection() as conn:
-            await conn.execute(
-                insert_query,
-                uuid.UUID(db_params["id"]),
-                uuid.UUID(db_params["user_id"]),
-                db_params["created_at"],
-                db_params["expires_at"],
-                db_params["status"],
-                db_params["token_hash"],
+        await self.db_manager.execute_command(
+            insert_query,
+            db_params["id"],
+            db_params["user_id"],
+            db_params["created_at"],
+            db_params["expires_at"],
+            db_params["status"],
+            db_params["token_hash"],
+            db_params["email"],
+        )
+
+    async def save_many(self, sessions: Sequence[Session]) -> None:
+        """Save many sessions at once (create or update) for bulk ingest.
+
+        Rows are streamed over COPY into a per-connection staging table and
+        upserted from there, so the cost does not grow with one round-trip
+        per session. Single saves keep using `save`, which needs only one.
+        """
+        if not sessions:
+            return
+
+        records = []
+        for session in sessions:
+            db_params = session_to_db_params(session)
+            records.append(tuple(db_params[column] for column in _COPY_COLUMNS))
+
+        async with (
+            self.db_manager.get_write_connection() as conn,
+            conn.transaction(),
+        ):
+            await conn.execute(_CREATE_STAGING_SQL)
+            await conn.copy_records_to_table(
+                "sessions_staging", records=records, columns=_COPY_COLUMNS
             )
+            await conn.execute(_UPSERT_FROM_STAGING_SQL)
 
 
 class PostgreSQLReadSessionRepository(ReadSessionRepository):
-    """PostgreSQL implementation of read session repository."""
+    """PostgreSQL implementation of read session repository.
+
+    Queries are served by the `idx_sessions_active` partial covering index;
+    keep its INCLUDE list in sync with the selected columns.
+    """
 
     def __init__(self, db_manager: DatabaseManager):
         self.db_manager = db_manager
 
     async def find_by_id(self, session_id: SessionId) -> Session | None:
         """Fast session lookup - optimized for token validation."""
-        query = """
-        SELECT s.id, s.user_id, s.created_at, s.expires_at,
-               s.status, u.email
-        FROM sessions s
-        JOIN users u ON s.user_id = u.id
-        WHERE s.id = $1
-            AND s.status = 'active'
-            AND s.expires_at > CURRENT_TIMESTAMP
-        """
-
-        async with self.db_manager.get_connection() as conn:
-            row = await conn.fetchrow(query, uuid.UUID(str(session_id)))
+        row = await self.db_manager.fetchrow_read(
+            _FIND_ACTIVE_BY_ID_SQL, session_id.value
+        )
 
         if not row:
             return None
 
-        # Use pure mapping function - note: this will detect active status from row
-        session = row_to_session(row)
-        # Override is_active since we already filtered for active sessions
-        return Session(
-            id=session.id,
-            user_id=session.user_id,
-            email=session.email,
-            permissions=session.permissions,
-            created_at=session.created_at,
-            expires_at=session.expires_at,
-            is_active=True,  # We already filtered for active sessions
+        return row_to_active_session(row)
+
+    async def find_by_ids(self, session_ids: list[SessionId]) -> dict[str, Session]:
+        """Look up many active sessions in one round-trip, keyed by session ID."""
+        # asyncpg's binary uuid codec accepts canonical strings directly, so
+        # ids are bound as-is instead of being parsed into uuid.UUID first
+        rows = await self.db_manager.fetch_read(
+            _FIND_ACTIVE_BY_IDS_SQL, [session_id.value for session_id in session_ids]
         )
+
+        return {str(row["id"]): row_to_active_session(row) for row in rows}
@@ -1,13 +1,49 @@
 """PostgreSQL implementation of user repositories."""
 
-import uuid
+from collections.abc import Sequence
 
 from heimdall.domain.entities import User
 from heimdall.domain.repositories.write_repositories import WriteUserRepository
 from heimdall.domain.value_objects import Email, UserId
 
 from .database import DatabaseManager
-from .mappers import row_to_user, user_to_db_params
+from .mappers import USER_COLUMNS, row_to_user, user_to_db_params
+
+# Built from USER_COLUMNS so the selected order always matches row_to_user
+_SELECT_USERS = "SELECT " + ", ".join(USER_COLUMNS) + "\nFROM users\n"
+
+# Emails are normalized to lowercase by the Email value object, so plain
+# equality on users.email uses its UNIQUE index directly
+_FIND_BY_EMAIL_SQL = _SELECT_USERS + "WHERE email = $1"
+
+_EXISTS_BY_EMAIL_SQL = "SELECT EXISTS(SELECT 1 FROM users WHERE email = $1)"
+
+_FIND_BY_ID_SQL = _SELECT_USERS + "WHERE id = $1"
+
+_FIND_BY_IDS_SQL = _SELECT_USERS + "WHERE id = ANY($1::uuid[])"
+
+_FIND_BY_EMAILS_SQL = _SELECT_USERS + "WHERE email = ANY($1::varchar[])"
+
+_INSERT_IF_NEW_EMAIL_SQL = """
+INSERT INTO users (id, email, password_hash, status, is_verified,
+                   created_at, updated_at, last_login_at)
+VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
+ON CONFLICT (email) DO NOTHING
+RETURNING id
+"""
+
+_UPSERT_SQL = """
+INSERT INTO users (id, email, password_hash, status, is_verified,
+                   created_at, updated_at, last_login_at)
+VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
+ON CONFLICT (id) DO UPDATE SET
+    email = EXCLUDED.email,
+    password_hash = EXCLUDED.password_hash,
+    status = EXCLUDED.status,
+    is_verified = EXCLUDED.is_verified,
+    last_login_at = EXCLUDED.last_login_at,
+    updated_at = CURRENT_TIMESTAMP
+"""
 
 
 class PostgreSQLUserRepository(WriteUserRepository):
@@ -18,15 +54,7 @@ class PostgreSQLUserRepository(WriteUserRepository):
 
     async def find_by_email(self, email: Email) -> User | None:
         """Find user by email for authentication."""
-        query = """
-        SELECT id, email, password_hash, status, is_verified,
-               created_at, updated_at, last_login_at
-        FROM users
-        WHERE email = $1
-        """
-
-        async with self.db_manager.get_connection() as conn:
-            row = await conn.fetchrow(query, str(email))
+        row = await self.db_manager.fetchrow(_FIND_BY_EMAIL_SQL, email.value)
 
         if not row:
             return None
@@ -35,73 +63,72 @@ class PostgreSQLUserRepository(WriteUserRepository):
 
     async def exists_by_email(self, email: Email) -> bool:
         """Check if user exists by email."""
-        query = "SELECT EXISTS(SELECT 1 FROM users WHERE email = $1)"
-
-        async with self.db_manager.get_connection() as conn:
-            result = await conn.fetchval(query, str(email))
+        result = await self.db_manager.fetchval(_EXISTS_BY_EMAIL_SQL, email.value)
 
         return bool(result)
 
     async def find_by_id(self, user_id: UserId) -> User | None:
         """Find user by ID."""
-        query = """
-        SELECT id, email, password_hash, status, is_verified,
-               created_at, updated_at, last_login_at
-        FROM users
-        WHERE id = $1
-        """
-
-        async with self.db_manager.get_connection() as conn:
-            row = await conn.fetchrow(query, uuid.UUID(str(user_id)))
+        row = await self.db_manager.fetchrow(_FIND_BY_ID_SQL, user_id.value)
 
         if not row:
             return None
 
         return row_to_user(row)
 
-    async def save(self, user: User) -> None:
-        """Save user (create or update)."""
-        # Check if user exists
-        exists_query = "SELECT EXISTS(SELECT 1 FROM users WHERE id = $1)"
+    async def find_by_ids(self, user_ids: Sequence[UserId]) -> dict[str, User]:
+        """Find many users by ID in one round-trip, keyed by ID."""
+        if not user_ids:
+            return {}
+
+        rows = await self.db_manager.execute_query(
+            _FIND_BY_IDS_SQL, [user_id.value for user_id in user_ids]
+        )
+
+        return {str(row["id"]): row_to_user(row) for row in rows}
+
+    async def find_by_emails(self, emails: Sequence[Email]) -> dict[str, User]:
+        """Find many users by email in one round-trip, keyed by email."""
+        if not emails:
+            return {}
+
+        rows = await self.db_manager.execute_query(
+            _FIND_BY_EMAILS_SQL, [email.value for email in emails]
+        )
+
+        return {row["email"]: row_to_user(row) for row in rows}
 
+    async def create_if_not_exists(self, user: User) -> bool:
+        """Insert a new user unless the email is taken, in one round-trip."""
+        db_params = user_to_db_params(user)
+
+        inserted = await self.db_manager.fetchval(
+            _INSERT_IF_NEW_EMAIL_SQL,
+            db_params["id"],
+            db_params["email"],
+            db_params["password_hash"],
+            db_params["status"],
+            db_params["is_verified"],
+            db_params["created_at"],
+            db_params["updated_at"],
+            db_params["last_login_at"],
+        )
+
+        return inserted is not None
+
+    async def save(self, user: User) -> None:
+        """Save user (create or update) in a single UPSERT round-trip."""
         # Use pure function to get database parameters
         db_params = user_to_db_params(user)
 
-        async with self.db_manager.get_connection() as conn:
-            exists = await conn.fetchval(exists_query, uuid.UUID(db_params["id"]))
-
-            if exists:
-                # Update existing user
-                update_query = """
-                UPDATE users
-                SET email = $2, password_hash = $3, status = $4,
-                    is_verified = $5, last_login_at = $6, updated_at = CURRENT_TIMESTAMP
-                WHERE id = $1
-                """
-                await conn.execute(
-                    update_query,
-                    uuid.UUID(db_params["id"]),
-                    db_params["email"],
-                    db_params["password_hash"],
-                    db_params["status"],
-                    db_params["is_verified"],
-                    db_params["last_login_at"],
-                )
-            else:
-                # Insert new user
-                insert_query = """
-                INSERT INTO users (id, email, password_hash, status, is_verified,
-                                 created_at, updated_at, last_login_at)
-                VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
-                """
-                await conn.execute(
-                    insert_query,
-                    uuid.UUID(db_params["id"]),
-                    db_params["email"],
-                    db_params["password_hash"],
-                    db_params["status"],
-                    db_params["is_verified"],
-                    db_params["created_at"],
-                    db_params["updated_at"],
-                    db_params["last_login_at"],
-                )
+        await self.db_manager.execute_command(
+            _UPSERT_SQL,
+            db_params["id"],
+            db_params["email"],
+            db_params["password_hash"],
+            db_params["status"],
+            db_params["is_verified"],
+            db_params["created_at"],
+            db_params["updated_at"],
+            db_params["last_login_at"],
+        )
@@ -0,0 +1,13 @@
+"""Redis persistence implementations."""
+
+from .session_repository import (
+    SESSION_KEY_PREFIX,
+    RedisReadSessionRepository,
+    RedisWriteSessionRepository,
+)
+
+__all__ = [
+    "SESSION_KEY_PREFIX",
+    "RedisReadSessionRepository",
+    "RedisWriteSessionRepository",
+]
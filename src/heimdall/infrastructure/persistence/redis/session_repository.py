@@ -0,0 +1,189 @@
+"""Redis cache-aside implementation of session repositories."""
+
+import asyncio
+import logging
+import time
+from datetime import UTC, datetime
+
+import orjson
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from heimdall.domain.entities import Session
+from heimdall.domain.repositories.read_repositories import ReadSessionRepository
+from heimdall.domain.repositories.write_repositories import WriteSessionRepository
+from heimdall.domain.value_objects import SessionId, UserIdValue
+from heimdall.domain.value_objects.email import EmailValue
+
+logger = logging.getLogger(__name__)
+
+SESSION_KEY_PREFIX = "heimdall:session:"
+
+# Cached in place of a revoked session so that a reader filling the cache from
+# a stale row (e.g. a lagging replica) cannot resurrect it; encoded sessions
+# are JSON arrays, so this never collides with one
+_REVOKED = b"revoked"
+
+
+def _encode(session: Session) -> bytes:
+    """Serialize the fields an active session needs to be rebuilt."""
+    return orjson.dumps(
+        (
+            session.user_id.value,
+            session.email.value,
+            session.permissions,
+            session.created_at.timestamp(),
+            session.expires_at.timestamp(),
+        )
+    )
+
+
+def _decode(session_id: SessionId, raw: bytes) -> Session:
+    """Rebuild a cached session; only active sessions are ever cached."""
+    user_id, email, permissions, created_at, expires_at = orjson.loads(raw)
+    return Session(
+        id=session_id,
+        user_id=UserIdValue(user_id),
+        email=EmailValue(email, email.partition("@")[2]),
+        permissions=tuple(permissions),
+        created_at=datetime.fromtimestamp(created_at, UTC),
+        expires_at=datetime.fromtimestamp(expires_at, UTC),
+        is_active=True,
+    )
+
+
+class RedisReadSessionRepository(ReadSessionRepository):
+    """Cache-aside session reads: Redis first, then the wrapped repository.
+
+    Misses are loaded from `fallback` and cached until the session expires,
+    capped at `max_ttl` seconds so a missed invalidation cannot outlive it.
+    Fills use SET NX so they never overwrite a revocation marker written by
+    `RedisWriteSessionRepository`. Redis errors degrade to reading from the
+    fallback.
+    """
+
+    def __init__(
+        self,
+        client: Redis,
+        fallback: ReadSessionRepository,
+        max_ttl: int = 300,
+        key_prefix: str = SESSION_KEY_PREFIX,
+    ):
+        self._client = client
+        self._fallback = fallback
+        self._max_ttl = max_ttl
+        self._key_prefix = key_prefix
+
+    async def find_by_id(self, session_id: SessionId) -> Session | None:
+        """Fast session lookup - optimized for token validation."""
+        key = self._key_prefix + session_id.value
+        try:
+            raw = await self._client.get(key)
+        except RedisError:
+            logger.warning("Session cache read failed, using fallback")
+            return await self._fallback.find_by_id(session_id)
+
+        if raw == _REVOKED:
+            return None
+        if raw is not None:
+            return _decode(session_id, raw)
+
+        session = await self._fallback.find_by_id(session_id)
+        if session is None or not session.is_valid():
+            return session
+
+        ttl = self._ttl_for(session)
+        if ttl > 0:
+            try:
+                await self._client.set(key, _encode(session), ex=ttl, nx=True)
+            except RedisError:
+                logger.warning("Session cache write failed")
+        return session
+
+    async def find_by_ids(self, session_ids: list[SessionId]) -> dict[str, Session]:
+        """Look up many sessions with one MGET, keyed by session ID.
+
+        Misses are resolved concurrently through the fallback (which coalesces
+        them when it batches) and written back in one pipeline.
+        """
+        keys = [self._key_prefix + session_id.value for session_id in session_ids]
+        try:
+            cached = await self._client.mget(keys)
+        except RedisError:
+            logger.warning("Session cache read failed, using fallback")
+            cached = [None] * len(keys)
+
+        found: dict[str, Session] = {}
+        missing: dict[str, SessionId] = {}
+        for session_id, raw in zip(session_ids, cached, strict=True):
+            if raw == _REVOKED:
+                continue
+            if raw is not None:
+                found[session_id.value] = _decode(session_id, raw)
+            else:
+                missing[session_id.value] = session_id
+        if not missing:
+            return found
+
+        loaded = await asyncio.gather(
+            *(self._fallback.find_by_id(session_id) for session_id in missing.values())
+        )
+        pipe = self._client.pipeline(transaction=False)
+        for session_id, session in zip(missing.values(), loaded, strict=True):
+            if session is None or not session.is_valid():
+                continue
+            found[session_id.value] = session
+            ttl = self._ttl_for(session)
+            if ttl > 0:
+                pipe.set(
+                    self._key_prefix + session_id.value,
+                    _encode(session),
+                    ex=ttl,
+                    nx=True,
+                )
+        if len(pipe):
+            try:
+                await pipe.execute()
+            except RedisError:
+                logger.warning("Session cache write failed")
+        return found
+
+    def _ttl_for(self, session: Session) -> int:
+        """Cache lifetime for a session: never past its expiry or `max_ttl`."""
+        return min(self._max_ttl, int(session.expires_at.timestamp() - time.time()))
+
+
+class RedisWriteSessionRepository(WriteSessionRepository):
+    """Write-through wrapper that keeps cached sessions in step with saves.
+
+    Saving an inactive session replaces its cached copy with a revocation
+    marker for `revoked_ttl` seconds rather than deleting it, so a concurrent
+    cache fill from a stale read cannot bring the session back. Redis errors
+    propagate: a logout must not report success while a cached copy could
+    keep the session valid.
+    """
+
+    def __init__(
+        self,
+        client: Redis,
+        inner: WriteSessionRepository,
+        key_prefix: str = SESSION_KEY_PREFIX,
+        revoked_ttl: int = 300,
+    ):
+        self._client = client
+        self._inner = inner
+        self._key_prefix = key_prefix
+        self._revoked_ttl = revoked_ttl
+
+    async def find_by_id(self, session_id: SessionId) -> Session | None:
+        """Find session by ID for commands."""
+        return await self._inner.find_by_id(session_id)
+
+    async def save(self, session: Session) -> None:
+        """Save session, then invalidate its cached copy."""
+        await self._inner.save(session)
+        key = self._key_prefix + session.id.value
+        if session.is_active:
+            await self._client.delete(key)
+        else:
+            await self._client.set(key, _REVOKED, ex=self._revoked_ttl)
@@ -1,17 +1,22 @@
 """FastAPI dependency injection setup for CQRS functions."""
 
 import os
-from collections.abc import Callable
-from typing import Any
-from unittest.mock import AsyncMock, Mock
+from functools import lru_cache
 
 from fastapi import Depends
+from redis.asyncio import Redis
 
 from heimdall.application.commands import CommandDependencies
-from heimdall.application.cqrs import curry_cqrs_functions
-from heimdall.application.queries import QueryDependencies
+from heimdall.application.cqrs import CQRSHandlers, curry_cqrs_functions
+from heimdall.application.queries import QueryDependencies, TokenValidationCache
 from heimdall.domain.entities import Session, User
+from heimdall.domain.repositories.write_repositories import (
+    WriteSessionRepository,
+    WriteUserRepository,
+)
 from heimdall.domain.value_objects import Token, TokenClaims
+from heimdall.infrastructure.cache import RedisRevocationChannel
+from heimdall.infrastructure.messaging import QueuedEventBus
 
 # PostgreSQL imports (available in postgres mode, will gracefully handle missing deps)
 try:
@@ -40,103 +45,154 @@ def should_use_postgres() -> bool:
 
 # Global in-memory storage for demo/testing (would be replaced with real DB)
 _USERS: dict[str, User] = {}
+_USERS_BY_ID: dict[str, User] = {}  # Secondary index over _USERS
 _SESSIONS: dict[str, Session] = {}
 _EVENTS: list = []
-_TOKEN_TO_SESSION: dict[str, str] = {}  # Maps token values to session IDs
 
+# Shared across requests so repeated validations of a token hit the cache
+_TOKEN_VALIDATION_CACHE = TokenValidationCache()
 
-_token_service_instance = None
+# Set when REDIS_URL is configured; broadcasts logouts to sibling workers and
+# backs the read-side session cache in postgres mode
+_redis_client: Redis | None = None
+_revocation_channel: RedisRevocationChannel | None = None
+
+
+async def start_token_revocation(redis_url: str) -> None:
+    """Connect to Redis and subscribe to cross-worker session revocations."""
+    global _redis_client, _revocation_channel  # noqa: PLW0603
+    _redis_client = Redis.from_url(redis_url)
+    _revocation_channel = RedisRevocationChannel(_redis_client, _TOKEN_VALIDATION_CACHE)
+    _revocation_channel.start()
+
+
+async def stop_token_revocation() -> None:
+    """Unsubscribe from session revocations and close the Redis client."""
+    global _redis_client, _revocation_channel  # noqa: PLW0603
+    if _revocation_channel is not None:
+        await _revocation_channel.stop()
+        _revocation_channel = None
+    _redis_client = None
+
+
+_JWT_HEADER = "eyJ0eXAiOiJKV1QiLCJhbGciOiJIUzI1NiJ9"
+
+
+class _TokenService:
+    """Demo token service that embeds the session ID in the token.
+
+    Tokens are self-describing, so validating one needs no token-to-session
+    map that would grow without bound and differ between workers.
+    """
+
+    def generate_token(self, session):
+        """Create a unique token value for this session (JWT format: 3 parts)."""
+        session_id = session.id.value
+        return Token(f"eyJ{session_id}.{_JWT_HEADER}.{session_id}signature")
+
+    def validate_token(self, token):
+        """Resolve a token to claims; in production this would decode the JWT."""
+        head, sep, _ = token.value.partition(".")
+        if not sep:
+            return None
+
+        session = _SESSIONS.get(head.removeprefix("eyJ"))
+        if session is None:
+            return None
+
+        return TokenClaims(
+            user_id=session.user_id,
+            session_id=session.id,
+            email=session.email.value,
+            permissions=session.permissions,
+        )
+
+
+_TOKEN_SERVICE = _TokenService()
 
 
 def get_token_service():
-    """Get shared mock token service instance."""
-    global _token_service_instance  # noqa: PLW0603
-    if _token_service_instance is None:
-        _token_service_instance = Mock()
-
-        def generate_token_impl(session):
-            # Create a unique token value for this session (JWT format: 3 parts)
-            token_value = (
-                f"eyJ{session.id}.eyJ0eXAiOiJKV1QiLCJhbGciOiJIUzI1NiJ9."
-                f"{session.id}signature"
-            )
-            # Map token to session for validation
-            _TOKEN_TO_SESSION[token_value] = str(session.id)
-            return Token(token_value)
-
-        def validate_token_impl(token):
-            # Simple validation for demo - in production would decode JWT
-            if token.value in _TOKEN_TO_SESSION:
-                # Find the correct session for this token
-                session_id = _TOKEN_TO_SESSION[token.value]
-                session = _SESSIONS.get(session_id)
-                if session:
-                    return TokenClaims(
-                        user_id=str(session.user_id),
-                        session_id=str(session.id),
-                        email=str(session.email),
-                        permissions=list(session.permissions)
-                        if hasattr(session, "permissions")
-                        else [],
-                    )
-            raise ValueError("Invalid token format")
-
-        _token_service_instance.generate_token = generate_token_impl
-        _token_service_instance.validate_token = validate_token_impl
-
-    return _token_service_instance
+    """Get shared in-memory token service instance."""
+    return _TOKEN_SERVICE
+
+
+async def _store_events(batch):
+    _EVENTS.extend(batch)
+
+
+# Events are batched off the request path; the flush task is bound to the
+# serving loop in start_event_bus (or on first publish outside the lifespan)
+_EVENT_BUS = QueuedEventBus(_store_events)
 
 
 def get_event_bus():
-    """Get mock event bus instance."""
-    event_bus = AsyncMock()
+    """Get shared in-memory event bus instance."""
+    return _EVENT_BUS
 
-    async def publish_impl(event):
-        _EVENTS.append(event)
 
-    event_bus.publish = publish_impl
-    return event_bus
+async def start_event_bus() -> None:
+    """Start flushing events on the running loop."""
+    _EVENT_BUS.start()
 
 
-def get_user_repository():
-    """Get mock user repository instance."""
-    user_repo = AsyncMock()
+async def close_event_bus() -> None:
+    """Flush any queued events."""
+    await _EVENT_BUS.stop()
 
-    async def find_by_email_impl(email):
-        return _USERS.get(str(email))
 
-    async def exists_by_email_impl(email):
-        return str(email) in _USERS
+class _InMemoryUserRepository(WriteUserRepository):
+    """Write user repository over the module-level demo dicts."""
 
-    async def save_impl(user):
-        _USERS[str(user.email)] = user
+    async def find_by_email(self, email):
+        """Find user by email."""
+        return _USERS.get(email.value)
 
-    async def find_by_id_impl(user_id):
-        for user in _USERS.values():
-            if str(user.id) == str(user_id):
-                return user
-        return None
+    async def exists_by_email(self, email):
+        """Check if user exists by email."""
+        return email.value in _USERS
 
-    user_repo.find_by_email = find_by_email_impl
-    user_repo.exists_by_email = exists_by_email_impl
-    user_repo.save = save_impl
-    user_repo.find_by_id = find_by_id_impl
-    return user_repo
+    async def save(self, user):
+        """Save user, keeping the ID index in step."""
+        _USERS[user.email.value] = user
+        _USERS_BY_ID[user.id.value] = user
 
+    async def create_if_not_exists(self, user):
+        """Insert a new user unless the email is taken."""
+        if _USERS.setdefault(user.email.value, user) is not user:
+            return False
+        _USERS_BY_ID[user.id.value] = user
+        return True
 
-def get_session_repository():
-    """Get mock session repository instance."""
-    session_repo = AsyncMock()
+    async def find_by_id(self, user_id):
+        """Find user by ID."""
+        return _USERS_BY_ID.get(user_id.value)
+
+
+class _InMemorySessionRepository(WriteSessionRepository):
+    """Session repository over the module-level demo dict."""
 
-    async def find_by_id_impl(session_id):
+    async def find_by_id(self, session_id):
+        """Find session by ID."""
         return _SESSIONS.get(str(session_id))
 
-    async def save_impl(session):
+    async def save(self, session):
+        """Save session."""
         _SESSIONS[str(session.id)] = session
 
-    session_repo.find_by_id = find_by_id_impl
-    session_repo.save = save_impl
-    return session_repo
+
+# Stateless wrappers over the shared dicts, so one instance serves every request
+_USER_REPOSITORY = _InMemoryUserRepository()
+_SESSION_REPOSITORY = _InMemorySessionRepository()
+
+
+def get_user_repository():
+    """Get shared in-memory user repository instance."""
+    return _USER_REPOSITORY
+
+
+def get_session_repository():
+    """Get shared in-memory session repository instance."""
+    return _SESSION_REPOSITORY
 
 
 # Create module-level Depends objects to avoid B008 warnings
@@ -158,6 +214,8 @@ def get_command_dependencies(
         session_repository=session_repo or get_session_repository(),
         token_service=token_service or get_token_service(),
         event_bus=event_bus or get_event_bus(),
+        token_cache=_TOKEN_VALIDATION_CACHE,
+        cache_invalidator=_revocation_channel,
     )
 
 
@@ -169,6 +227,7 @@ def get_query_dependencies(
     return QueryDependencies(
         session_repository=session_repo or get_session_repository(),
         token_service=token_service or get_token_service(),
+        token_cache=_TOKEN_VALIDATION_CACHE,
     )
 
 
@@ -185,6 +244,8 @@ def get_command_dependencies_fastapi(
         session_repository=session_repo,
         token_service=token_service,
         event_bus=event_bus,
+        token_cache=_TOKEN_VALIDATION_CACHE,
+        cache_invalidator=_revocation_channel,
     )
 
 
@@ -196,6 +257,7 @@ def get_query_dependencies_fastapi(
     return QueryDependencies(
         session_repository=session_repo,
         token_service=token_service,
+        token_cache=_TOKEN_VALIDATION_CACHE,
     )
 
 
@@ -211,7 +273,9 @@ def get_dynamic_command_dependencies() -> CommandDependencies:
     if should_use_postgres():
         postgres_cmd_deps, _ = _get_postgresql_dependencies()
         if postgres_cmd_deps:
-            return postgres_cmd_deps()
+            return postgres_cmd_deps(
+                _TOKEN_VALIDATION_CACHE, _revocation_channel, _redis_client
+            )
     # Fallback to mock dependencies
     return get_command_dependencies()
 
@@ -221,7 +285,7 @@ def get_dynamic_query_dependencies() -> QueryDependencies:
     if should_use_postgres():
         _, postgres_query_deps = _get_postgresql_dependencies()
         if postgres_query_deps:
-            return postgres_query_deps()
+            return postgres_query_deps(_TOKEN_VALIDATION_CACHE, _redis_client)
     # Fallback to mock dependencies
     return get_query_dependencies()
 
@@ -231,30 +295,29 @@ _COMMAND_DEPS_DEPENDENCY = Depends(get_dynamic_command_dependencies)
 _QUERY_DEPS_DEPENDENCY = Depends(get_dynamic_query_dependencies)
 
 
+# Dependencies are frozen dataclasses over process-wide singletons, so equal
+# deps recur on every request and their bound handlers can be reused
+_curried_handlers = lru_cache(maxsize=4)(curry_cqrs_functions)
+
+
 def get_auth_functions(
     command_deps: CommandDependencies | None = None,
     query_deps: QueryDependencies | None = None,
-) -> dict[str, Callable[..., Any]]:
+) -> CQRSHandlers:
     """Get curried CQRS auth functions with dynamic backend selection."""
-    persistence_mode = get_persistence_mode()
-    print(f"🔧 Using persistence mode: {persistence_mode}")
-
     # If dependencies aren't provided, create them directly (for non-FastAPI usage)
     if command_deps is None:
         command_deps = get_dynamic_command_dependencies()
     if query_deps is None:
         query_deps = get_dynamic_query_dependencies()
 
-    return curry_cqrs_functions(command_deps, query_deps)
+    return _curried_handlers(command_deps, query_deps)
 
 
 # FastAPI dependency version that uses Depends()
 def get_auth_functions_fastapi(
     command_deps: CommandDependencies = _COMMAND_DEPS_DEPENDENCY,
     query_deps: QueryDependencies = _QUERY_DEPS_DEPENDENCY,
-) -> dict[str, Callable[..., Any]]:
+) -> CQRSHandlers:
     """FastAPI version that uses Depends() for dependency injection."""
-    persistence_mode = get_persistence_mode()
-    print(f"🔧 Using persistence mode: {persistence_mode}")
-
-    return curry_cqrs_functions(command_deps, query_deps)
+    return _curried_handlers(command_deps, query_deps)
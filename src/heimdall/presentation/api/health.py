@@ -1,28 +1,36 @@
 """Health check endpoints for monitoring and observability."""
 
 import os
+import sys
 from datetime import UTC, datetime
 from typing import Any
 
-from fastapi import APIRouter, Depends
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi import APIRouter, Depends, Response
 
 from heimdall.presentation.api.schemas import HealthCheckResponseSchema
 
 router = APIRouter(tags=["health"])
 
 
+# Constant for the life of the worker, so computed once rather than per probe
+_STATIC_SYSTEM_INFO: dict[str, Any] = {
+    "version": os.getenv("HEIMDALL_VERSION", "1.0.0-dev"),
+    "environment": os.getenv("ENVIRONMENT", "development"),
+    "python_version": (
+        f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
+    ),
+}
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time in ISO 8601 with a `Z` suffix."""
+    return datetime.now(UTC).isoformat().replace("+00:00", "Z")
+
+
 def get_system_info() -> dict[str, Any]:
     """Get basic system information for health checks."""
-    return {
-        "timestamp": datetime.now(UTC).isoformat().replace("+00:00", "Z"),
-        "version": os.getenv("HEIMDALL_VERSION", "1.0.0-dev"),
-        "environment": os.getenv("ENVIRONMENT", "development"),
-        "python_version": (
-            f"{os.sys.version_info.major}.{os.sys.version_info.minor}."
-            f"{os.sys.version_info.micro}"
-        ),
-    }
+    return {"timestamp": _utc_timestamp(), **_STATIC_SYSTEM_INFO}
 
 
 @router.get(
@@ -46,10 +54,11 @@ async def health_check(
     "/health/detailed",
     summary="Detailed Health Check",
     description="Detailed health check with system information and dependency status",
+    response_class=Response,
 )
 async def detailed_health_check(
     system_info: dict[str, Any] = Depends(get_system_info),  # noqa: B008
-) -> JSONResponse:
+) -> Response:
     """Detailed health check with system and dependency information."""
     # TODO: Add actual dependency checks when implemented
     dependencies = {
@@ -75,24 +84,29 @@ async def detailed_health_check(
         },
     }
 
-    return JSONResponse(content=health_data)
+    return Response(content=orjson.dumps(health_data), media_type="application/json")
+
+
+# Probe bodies are fixed apart from the timestamp, which never needs JSON
+# escaping, so they are formatted straight into bytes
+_READY_BODY = b'{"status":"ready","timestamp":"%s"}'
+_ALIVE_BODY = b'{"status":"alive","timestamp":"%s"}'
 
 
 @router.get(
     "/ready",
     summary="Readiness Check",
     description="Kubernetes readiness probe endpoint",
+    response_class=Response,
 )
-async def readiness_check() -> JSONResponse:
+async def readiness_check() -> Response:
     """Kubernetes readiness probe endpoint."""
     # TODO: Check if all dependencies are ready
     # For now, always return ready since we use in-memory implementations
 
-    return JSONResponse(
-        content={
-            "status": "ready",
-            "timestamp": datetime.now(UTC).isoformat().replace("+00:00", "Z"),
-        }
+    return Response(
+        content=_READY_BODY % _utc_timestamp().encode(),
+        media_type="application/json",
     )
 
 
@@ -100,13 +114,12 @@ async def readiness_check() -> JSONResponse:
     "/live",
     summary="Liveness Check",
     description="Kubernetes liveness probe endpoint",
+    response_class=Response,
 )
-async def liveness_check() -> JSONResponse:
+async def liveness_check() -> Response:
     """Kubernetes liveness probe endpoint."""
     # Basic liveness check - if we can respond, we're alive
-    return JSONResponse(
-        content={
-            "status": "alive",
-            "timestamp": datetime.now(UTC).isoformat().replace("+00:00", "Z"),
-        }
+    return Response(
+        content=_ALIVE_BODY % _utc_timestamp().encode(),
+        media_type="application/json",
     )
@@ -1,15 +1,25 @@
 """FastAPI main application configuration."""
 
+import logging
 import os
+import queue
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener
 
 from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from starlette.exceptions import HTTPException as StarletteHTTPException
-
+from starlette.middleware import Middleware
+
+from heimdall.presentation.api.dependencies import (
+    close_event_bus,
+    start_event_bus,
+    start_token_revocation,
+    stop_token_revocation,
+)
 from heimdall.presentation.api.health import router as health_router
 from heimdall.presentation.api.routes import router as auth_router
 
@@ -19,62 +29,127 @@ try:
         close_database,
         initialize_database,
     )
+    from heimdall.infrastructure.persistence.postgres.dependencies import (
+        close_postgresql_dependencies,
+    )
 
     POSTGRES_AVAILABLE = True
 except ImportError:
     POSTGRES_AVAILABLE = False
     initialize_database = None
     close_database = None
+    close_postgresql_dependencies = None
+
+
+logger = logging.getLogger(__name__)
+
+# Application logs are handed to a background thread through a queue, so
+# writing them never blocks the event loop on stdout
+_log_listener: QueueListener | None = None
+
+
+def start_logging() -> None:
+    """Attach a queue-backed handler to the heimdall logger hierarchy."""
+    global _log_listener  # noqa: PLW0603
+    if _log_listener is not None:
+        return
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(
+        logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+    )
+
+    heimdall_logger = logging.getLogger("heimdall")
+    heimdall_logger.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+    heimdall_logger.addHandler(QueueHandler(log_queue))
+
+    _log_listener = QueueListener(log_queue, stream_handler)
+    _log_listener.start()
+
+
+def stop_logging() -> None:
+    """Flush queued log records and detach the queue handler."""
+    global _log_listener  # noqa: PLW0603
+    if _log_listener is None:
+        return
+
+    _log_listener.stop()
+    _log_listener = None
+    heimdall_logger = logging.getLogger("heimdall")
+    for handler in list(heimdall_logger.handlers):
+        if isinstance(handler, QueueHandler):
+            heimdall_logger.removeHandler(handler)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
     """Application lifespan manager for startup and shutdown events."""
     # Startup
-    print("🚀 Heimdall authentication service starting up...")
+    start_logging()
+    logger.info("Heimdall authentication service starting up")
 
     # Initialize database if using PostgreSQL
     persistence_mode = os.getenv("PERSISTENCE_MODE", "in-memory").lower()
     use_postgres = persistence_mode == "postgres"
+    logger.info("Using persistence mode: %s", persistence_mode)
 
     if use_postgres:
         if POSTGRES_AVAILABLE and initialize_database:
             try:
                 await initialize_database()
-                print("✅ PostgreSQL database connection initialized")
-            except Exception as e:
-                print(
-                    f"⚠️ Failed to initialize database: {e}, "
-                    "using in-memory repositories"
+                logger.info("PostgreSQL database connection initialized")
+            except Exception:
+                logger.exception(
+                    "Failed to initialize database, using in-memory repositories"
                 )
         else:
-            print(
-                "⚠️ PostgreSQL dependencies not available, using in-memory repositories"
+            logger.warning(
+                "PostgreSQL dependencies not available, using in-memory "
+                "repositories. Install with: pip install asyncpg"
             )
-            print("   Install with: pip install asyncpg")
 
-    print("✅ Heimdall ready to guard the Bifrost Bridge!")
+    await start_event_bus()
+
+    # Share logout revocations across workers when Redis is configured
+    redis_url = os.getenv("REDIS_URL")
+    if redis_url:
+        await start_token_revocation(redis_url)
+
+    logger.info("Heimdall ready to guard the Bifrost Bridge")
 
     yield
 
     # Shutdown
-    print("🛑 Heimdall authentication service shutting down...")
+    logger.info("Heimdall authentication service shutting down")
+
+    await stop_token_revocation()
+    await close_event_bus()
 
     # Close database connections if using PostgreSQL
     persistence_mode = os.getenv("PERSISTENCE_MODE", "in-memory").lower()
     if persistence_mode == "postgres" and POSTGRES_AVAILABLE and close_database:
         try:
+            await close_postgresql_dependencies()
             await close_database()
-            print("✅ PostgreSQL database connections closed")
-        except Exception as e:
-            print(f"⚠️ Error closing database: {e}")
+            logger.info("PostgreSQL database connections closed")
+        except Exception:
+            logger.exception("Error closing database")
 
-    print("✅ Heimdall shutdown complete")
+    logger.info("Heimdall shutdown complete")
+    stop_logging()
+
+
+def get_cors_origins() -> list[str]:
+    """Get allowed CORS origins from the comma-separated CORS_ORIGINS variable."""
+    origins = os.getenv("CORS_ORIGINS", "*").split(",")
+    return [origin.strip() for origin in origins if origin.strip()] or ["*"]
 
 
 def create_app() -> FastAPI:
     """Create and configure FastAPI application."""
     # Application metadata
+    cors_origins = get_cors_origins()
     app = FastAPI(
         title="Heimdall Authentication Service",
         description=(
@@ -85,15 +160,17 @@ def create_app() -> FastAPI:
         redoc_url="/redoc",
         openapi_url="/openapi.json",
         lifespan=lifespan,
-    )
-
-    # CORS middleware for frontend integration
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=["*"],  # TODO: Configure for production
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
+        # CORS middleware for frontend integration. Credentials are only
+        # allowed for explicit origins; browsers reject them with a wildcard.
+        middleware=[
+            Middleware(
+                CORSMiddleware,
+                allow_origins=cors_origins,
+                allow_credentials=cors_origins != ["*"],
+                allow_methods=["*"],
+                allow_headers=["*"],
+            )
+        ],
     )
 
     # Custom exception handlers
@@ -1,10 +1,8 @@
 """FastAPI authentication routes."""
 
-from collections.abc import Callable
-from typing import Any
-
 from fastapi import APIRouter, Depends, Header, HTTPException, status
 
+from heimdall.application.cqrs import CQRSHandlers
 from heimdall.application.dto import LoginRequest, RegisterRequest
 from heimdall.domain.value_objects import Token
 from heimdall.presentation.api.dependencies import get_auth_functions_fastapi
@@ -33,7 +31,7 @@ router = APIRouter(prefix="/auth", tags=["authentication"])
 )
 async def login(
     request: LoginRequestSchema,
-    auth_functions: dict[str, Callable[..., Any]] = Depends(get_auth_functions_fastapi),  # noqa: B008
+    auth_functions: CQRSHandlers = Depends(get_auth_functions_fastapi),  # noqa: B008
 ) -> LoginResponseSchema:
     """Login endpoint for user authentication."""
     try:
@@ -44,12 +42,12 @@ async def login(
         )
 
         # Execute login command through CQRS
-        response = await auth_functions["login"](login_request)
+        response = await auth_functions.login(login_request)
 
         # Convert domain response to API schema
         return LoginResponseSchema(
             access_token=response.access_token,
-            token_type="bearer",  # noqa: S106
+            token_type=response.token_type,
         )
 
     except ValueError as e:
@@ -76,7 +74,7 @@ async def login(
 )
 async def register(
     request: RegisterRequestSchema,
-    auth_functions: dict[str, Callable[..., Any]] = Depends(get_auth_functions_fastapi),  # noqa: B008
+    auth_functions: CQRSHandlers = Depends(get_auth_functions_fastapi),  # noqa: B008
 ) -> RegisterResponseSchema:
     """Registration endpoint for new user accounts."""
     try:
@@ -87,7 +85,7 @@ async def register(
         )
 
         # Execute register command through CQRS
-        response = await auth_functions["register"](register_request)
+        response = await auth_functions.register(register_request)
 
         # Convert domain response to API schema
         return RegisterResponseSchema(
@@ -119,7 +117,7 @@ async def register(
 )
 async def validate_token(
     request: ValidateTokenRequestSchema,
-    auth_functions: dict[str, Callable[..., Any]] = Depends(get_auth_functions_fastapi),  # noqa: B008
+    auth_functions: CQRSHandlers = Depends(get_auth_functions_fastapi),  # noqa: B008
 ) -> ValidateTokenResponseSchema:
     """Token validation endpoint for authentication verification."""
     try:
@@ -127,7 +125,7 @@ async def validate_token(
         token = Token(request.token)
 
         # Execute validate query through CQRS
-        response = await auth_functions["validate"](token)
+        response = await auth_functions.validate(token)
 
         # Convert domain response to API schema
         permissions = []
@@ -142,9 +140,9 @@ async def validate_token(
             error=response.error if not response.is_valid else None,
         )
 
-    except Exception as e:
-        # Token validation should not fail with HTTP errors
-        # Instead return invalid token response
+    except ValueError as e:
+        # Malformed tokens are reported in the body, not as HTTP errors.
+        # Expected failures (unknown/expired/revoked) come back as responses.
         return ValidateTokenResponseSchema(
             is_valid=False,
             user_id=None,
@@ -165,7 +163,7 @@ async def validate_token(
 )
 async def get_current_user(
     authorization: str | None = Header(None),
-    auth_functions: dict[str, Callable[..., Any]] = Depends(get_auth_functions_fastapi),  # noqa: B008
+    auth_functions: CQRSHandlers = Depends(get_auth_functions_fastapi),  # noqa: B008
 ) -> ValidateTokenResponseSchema:
     """Get current user information from JWT token in Authorization header."""
     if not authorization or not authorization.startswith("Bearer "):
@@ -181,7 +179,7 @@ async def get_current_user(
         token = Token(token_value)
 
         # Execute validate query through CQRS
-        response = await auth_functions["validate"](token)
+        response = await auth_functions.validate(token)
 
         if not response.is_valid:
             raise HTTPException(
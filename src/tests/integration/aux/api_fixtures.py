@@ -7,6 +7,7 @@ import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
 
 from heimdall.infrastructure.persistence.postgres.database import (
+    get_database_manager,
     initialize_database,
 )
 from heimdall.presentation.api.main import create_app
@@ -33,3 +34,6 @@ async def api_client() -> AsyncIterator[AsyncClient]:
         yield client
         # Clean database after test
         await cleanup_database()
+
+    # Release pooled connections; each test runs on its own event loop
+    await get_database_manager().close()
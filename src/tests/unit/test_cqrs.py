@@ -1,14 +1,15 @@
 """Tests for CQRS implementation."""
 
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
+from heimdall.application import cqrs
 from heimdall.application.commands import (
     CommandDependencies,
     login_user_command,
 )
-from heimdall.application.cqrs import curry_cqrs_functions
+from heimdall.application.cqrs import CQRSHandlers, curry_cqrs_functions
 from heimdall.application.dto import LoginRequest
 from heimdall.application.queries import QueryDependencies, validate_token_query
 from heimdall.domain.entities import User
@@ -33,7 +34,6 @@ class TestCQRSCommands:
         user = User.create(Email("test@example.com"), Password("Password123"))
         session = Mock()
         session.id = generate_session_id()
-        user.authenticate = Mock(return_value=session)
 
         # Write-optimized repositories
         write_user_repo = AsyncMock()
@@ -58,7 +58,8 @@ class TestCQRSCommands:
         )
 
         # Act
-        response = await login_user_command(request, command_deps)
+        with patch.object(User, "authenticate", return_value=session):
+            response = await login_user_command(request, command_deps)
 
         # Assert
         assert response.access_token == "fake.jwt.token"
@@ -84,7 +85,11 @@ class TestCQRSQueries:
             permissions=["read"],
         )
 
-        session = Mock()
+        session = Mock(
+            user_id=claims.user_id,
+            email=claims.email,
+            permissions=claims.permissions,
+        )
         session.is_valid.return_value = True
 
         # Read-optimized dependencies (minimal)
@@ -114,7 +119,7 @@ class TestCQRSFunctional:
     """Test functional CQRS interface with curried functions."""
 
     @pytest.mark.asyncio
-    async def test_curry_cqrs_functions_creates_partial_functions(self):
+    async def test_curry_cqrs_functions_creates_bound_functions(self):
         """Test curry_cqrs_functions creates curried functions with CQRS separation."""
         # Arrange - separate dependencies for commands and queries
         command_deps = CommandDependencies(
@@ -132,25 +137,33 @@ class TestCQRSFunctional:
         # Act - create curried functions
         cqrs_functions = curry_cqrs_functions(command_deps, query_deps)
 
-        # Assert - verify functional interface
-        assert "login" in cqrs_functions  # Command
-        assert "register" in cqrs_functions  # Command
-        assert "logout" in cqrs_functions  # Command
-        assert "validate" in cqrs_functions  # Query
+        # Assert - verify functional interface (immutable, attribute access)
+        assert isinstance(cqrs_functions, CQRSHandlers)
+        assert cqrs_functions._fields == ("login", "register", "logout", "validate")
 
         # Verify these are callable functions
-        assert callable(cqrs_functions["login"])
-        assert callable(cqrs_functions["validate"])
+        assert callable(cqrs_functions.login)
+        assert callable(cqrs_functions.validate)
+
+    @pytest.mark.asyncio
+    async def test_curried_functions_forward_bound_deps(self, monkeypatch):
+        """Test curried functions pass their baked-in deps and accept one argument."""
+        # Arrange - record what the underlying handlers receive
+        command_deps, query_deps = Mock(), Mock()
 
-        # Verify that functions work with just the primary parameter
-        # (deps should be baked in via partial application)
+        async def echo(request, deps):
+            return request, deps
 
-        # These should work without needing to pass deps explicitly
-        login_func = cqrs_functions["login"]
-        validate_func = cqrs_functions["validate"]
+        monkeypatch.setattr(cqrs, "login_user_command", echo)
+        monkeypatch.setattr(cqrs, "validate_token_query", echo)
+        cqrs_functions = curry_cqrs_functions(command_deps, query_deps)
 
-        # Functions should be partial objects with deps already applied
-        assert hasattr(login_func, "keywords")  # partial objects have this
-        assert hasattr(validate_func, "keywords")
-        assert "deps" in login_func.keywords
-        assert "deps" in validate_func.keywords
+        # Act
+        login_result = await cqrs_functions.login("login-request")
+        validate_result = await cqrs_functions.validate("token")
+
+        # Assert - deps are bound and cannot be swapped by callers
+        assert login_result == ("login-request", command_deps)
+        assert validate_result == ("token", query_deps)
+        with pytest.raises(TypeError):
+            cqrs_functions.validate("token", Mock())
@@ -8,7 +8,7 @@ import pytest
 from heimdall.application.commands import CommandDependencies
 from heimdall.application.cqrs import curry_cqrs_functions
 from heimdall.application.dto import LoginRequest
-from heimdall.application.queries import QueryDependencies
+from heimdall.application.queries import QueryDependencies, validate_token_query
 from heimdall.domain.value_objects import Token, TokenClaims, generate_session_id
 
 
@@ -36,7 +36,7 @@ class TestCQRSErrorHandling:
 
         # Act
         token = Token("invalid.jwt.token")
-        result = await auth_functions["validate"](token)
+        result = await auth_functions.validate(token)
 
         # Assert - Graceful error handling
         assert result.is_valid is False
@@ -46,6 +46,54 @@ class TestCQRSErrorHandling:
         # Session repository should not be called for invalid tokens
         session_repo.find_by_id.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_query_handles_unknown_token_without_raising(self):
+        """Test that a token service miss returns a shared invalid response."""
+        # Arrange
+        token_service = Mock()
+        token_service.validate_token.return_value = None
+
+        session_repo = AsyncMock()
+
+        query_deps = QueryDependencies(
+            session_repository=session_repo,
+            token_service=token_service,
+        )
+
+        # Act
+        first = await validate_token_query(Token("unknown.jwt.token"), query_deps)
+        second = await validate_token_query(Token("other.jwt.token"), query_deps)
+
+        # Assert
+        assert first.is_valid is False
+        assert first.error == "Invalid token"
+        assert first.permissions == ()
+        assert second is first
+        session_repo.find_by_id.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_query_rejects_expired_token_before_verifying(self):
+        """Test that an expired exp claim short-circuits signature checks."""
+        # Arrange
+        token_service = Mock()
+        query_deps = QueryDependencies(
+            session_repository=AsyncMock(),
+            token_service=token_service,
+        )
+        expired_token = Token(
+            "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9."
+            "eyJzdWIiOiIxMjM0NTY3ODkwIiwiZXhwIjoxMDAwMDAwMDAwfQ."
+            "signature"
+        )
+
+        # Act
+        result = await validate_token_query(expired_token, query_deps)
+
+        # Assert
+        assert result.is_valid is False
+        assert result.error == "Token has expired"
+        token_service.validate_token.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_query_handles_missing_session_gracefully(self):
         """Test that queries handle missing sessions without exceptions."""
@@ -75,11 +123,13 @@ class TestCQRSErrorHandling:
 
         # Act
         token = Token("valid.jwt.token")  # Valid JWT format
-        result = await auth_functions["validate"](token)
+        result = await auth_functions.validate(token)
+        again = await auth_functions.validate(token)
 
-        # Assert - Should handle gracefully
+        # Assert - Should handle gracefully with one shared response
         assert result.is_valid is False
         assert result.error == "Invalid session"
+        assert again is result
 
     @pytest.mark.asyncio
     async def test_query_handles_expired_session_gracefully(self):
@@ -113,7 +163,7 @@ class TestCQRSErrorHandling:
 
         # Act
         token = Token("expired.session.token")
-        result = await auth_functions["validate"](token)
+        result = await auth_functions.validate(token)
 
         # Assert - Should reject expired sessions
         assert result.is_valid is False
@@ -144,7 +194,11 @@ class TestCQRSErrorHandling:
         claims = TokenClaims("user123", str(session_id), "test@example.com")
         token_service.validate_token.return_value = claims
 
-        session = Mock()
+        session = Mock(
+            user_id=claims.user_id,
+            email=claims.email,
+            permissions=claims.permissions,
+        )
         session.is_valid.return_value = True
 
         session_repo = AsyncMock()
@@ -159,7 +213,7 @@ class TestCQRSErrorHandling:
 
         # Act - Query should work despite broken command dependencies
         token = Token("working.jwt.token")  # Valid JWT format
-        result = await auth_functions["validate"](token)
+        result = await auth_functions.validate(token)
 
         # Assert - Query isolation from command failures
         assert result.is_valid is True
@@ -168,7 +222,7 @@ class TestCQRSErrorHandling:
         # Commands would fail, but queries are isolated
         login_request = LoginRequest(email="test@example.com", password="Password123")
         with pytest.raises(Exception, match="Database connection failed"):
-            await auth_functions["login"](login_request)
+            await auth_functions.login(login_request)
 
     @pytest.mark.asyncio
     async def test_partial_function_error_handling(self):
@@ -186,7 +240,7 @@ class TestCQRSErrorHandling:
                 invalid_command_deps, valid_query_deps
             )
             # The error occurs when trying to access attributes of None
-            await auth_functions["login"](
+            await auth_functions.login(
                 LoginRequest(email="test@test.com", password="Password123")
             )
 
@@ -205,7 +259,7 @@ class TestCQRSErrorHandling:
 
         token_service.validate_token.side_effect = validate_token_side_effect
 
-        session = Mock()
+        session = Mock(user_id="user123", email="test@example.com", permissions=[])
         session.is_valid.return_value = True
 
         session_repo = AsyncMock()
@@ -226,8 +280,8 @@ class TestCQRSErrorHandling:
         bad_token = Token("bad.jwt.token")  # Valid JWT format
 
         good_result, bad_result = await asyncio.gather(
-            auth_functions["validate"](good_token),
-            auth_functions["validate"](bad_token),
+            auth_functions.validate(good_token),
+            auth_functions.validate(bad_token),
             return_exceptions=False,  # Don't stop on exceptions
         )
 
@@ -1,6 +1,6 @@
 """Tests for CQRS functional implementation."""
 
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
@@ -34,9 +34,6 @@ class TestFunctionalLogin:
         session = Mock()
         session.id = generate_session_id()
 
-        # Mock authenticate to return our session
-        user.authenticate = Mock(return_value=session)
-
         # Create mocks
         user_repo = AsyncMock()
         user_repo.find_by_email.return_value = user
@@ -60,13 +57,14 @@ class TestFunctionalLogin:
             event_bus=event_bus,
         )
 
-        # Act
-        response = await login_user_command(request, command_deps)
+        # Act - authenticate returns our session
+        with patch.object(User, "authenticate", return_value=session) as authenticate:
+            response = await login_user_command(request, command_deps)
 
         # Assert
         assert response.access_token == "fake.jwt.token"
         user_repo.find_by_email.assert_called_once_with(Email("test@example.com"))
-        user.authenticate.assert_called_once_with(Password("Password123"))
+        authenticate.assert_called_once_with(Password("Password123"))
         user_repo.save.assert_called_once_with(user)
         session_repo.save.assert_called_once_with(session)
         token_service.generate_token.assert_called_once_with(session)
@@ -108,8 +106,7 @@ class TestFunctionalRegister:
         request = RegisterRequest(email="test@example.com", password="Password123")
 
         user_repo = AsyncMock()
-        user_repo.exists_by_email.return_value = False
-        user_repo.save = AsyncMock()
+        user_repo.create_if_not_exists.return_value = True
 
         event_bus = AsyncMock()
         event_bus.publish = AsyncMock()
@@ -128,8 +125,10 @@ class TestFunctionalRegister:
         # Assert
         assert response.email == "test@example.com"
         assert response.user_id  # Should have a user ID
-        user_repo.exists_by_email.assert_called_once_with(Email("test@example.com"))
-        user_repo.save.assert_called_once()
+        user_repo.create_if_not_exists.assert_called_once()
+        created = user_repo.create_if_not_exists.call_args.args[0]
+        assert created.email == Email("test@example.com")
+        user_repo.exists_by_email.assert_not_called()
         event_bus.publish.assert_called_once()
 
     @pytest.mark.asyncio
@@ -139,7 +138,7 @@ class TestFunctionalRegister:
         request = RegisterRequest(email="test@example.com", password="Password123")
 
         user_repo = AsyncMock()
-        user_repo.exists_by_email.return_value = True
+        user_repo.create_if_not_exists.return_value = False
 
         event_bus = AsyncMock()
 
@@ -154,6 +153,7 @@ class TestFunctionalRegister:
         # Act & Assert
         with pytest.raises(ValueError, match="User with this email already exists"):
             await register_user_command(request, command_deps)
+        event_bus.publish.assert_not_called()
 
 
 class TestFunctionalValidateToken:
@@ -172,7 +172,11 @@ class TestFunctionalValidateToken:
             permissions=["read"],
         )
 
-        session = Mock()
+        session = Mock(
+            user_id=claims.user_id,
+            email=claims.email,
+            permissions=claims.permissions,
+        )
         session.is_valid.return_value = True
 
         token_service = Mock()
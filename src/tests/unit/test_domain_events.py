@@ -1,5 +1,7 @@
 """Tests for domain events."""
 
+import sys
+import uuid
 from datetime import UTC, datetime
 
 from heimdall.domain.events import (
@@ -35,6 +37,17 @@ class TestDomainEvent:
         assert event.event_type == "TestEvent"
         assert isinstance(event, DomainEventValue)
 
+    def test_event_ids_are_unique_v4_uuids(self):
+        """Test pooled event ids parse as distinct version-4 UUIDs."""
+        ids = [DomainEvent("TestEvent", {}).event_id for _ in range(600)]
+
+        parsed = [uuid.UUID(event_id) for event_id in ids]
+
+        assert len(set(ids)) == len(ids)
+        assert all(u.version == 4 for u in parsed)
+        assert all(u.variant == uuid.RFC_4122 for u in parsed)
+        assert [str(u) for u in parsed] == ids
+
     def test_to_dict(self):
         """Test converting event to dictionary."""
         event = DomainEvent("TestEvent", {"test": "value"})
@@ -123,6 +136,17 @@ class TestUserEvents:
         data = event.to_dict()
         assert data["data"]["permission"] == permission
 
+    def test_permission_events_share_interned_strings(self):
+        """Test permission names are interned so queued events share them."""
+        user_id = generate_user_id()
+        permission = "".join(["user", ":read"])
+
+        granted = UserPermissionGranted(user_id=user_id, permission=permission)
+        revoked = UserPermissionRevoked(user_id=user_id, permission=permission)
+
+        assert granted.data["permission"] is sys.intern("user:read")
+        assert revoked.data["permission"] is granted.data["permission"]
+
     def test_user_permission_revoked_event(self):
         """Test UserPermissionRevoked event."""
         user_id = generate_user_id()
@@ -31,7 +31,7 @@ class TestUser:
         assert user.password_hash.value  # Should have a hash value
         assert user.is_active is True
         assert user.is_verified is False
-        assert user.permissions == []
+        assert user.permissions == set()
         assert isinstance(user.created_at, datetime)
         assert isinstance(user.updated_at, datetime)
         assert user.last_login_at is None
@@ -47,9 +47,21 @@ class TestUser:
         assert isinstance(session, Session)
         assert session.user_id == user.id
         assert session.email == user.email
-        assert session.permissions == user.permissions
+        assert session.permissions == tuple(sorted(user.permissions))
         assert user.last_login_at is not None
 
+    def test_authenticate_freezes_permissions_in_stable_order(self):
+        """Test the session gets a sorted tuple snapshot of the permission set."""
+        password = Password("ValidPass123")
+        user = User.create(Email("test@example.com"), password)
+        user.grant_permission("write")
+        user.grant_permission("read")
+
+        session = user.authenticate(password)
+        user.grant_permission("admin")
+
+        assert session.permissions == ("read", "write")
+
     def test_authenticate_wrong_password(self):
         """Test authentication with wrong password."""
         email = Email("test@example.com")
@@ -112,7 +124,7 @@ class TestUser:
         user.grant_permission("read")
         user.grant_permission("read")
 
-        assert user.permissions.count("read") == 1
+        assert user.permissions == {"read"}
 
     def test_revoke_permission(self):
         """Test revoking permission from user."""
@@ -130,7 +142,7 @@ class TestUser:
     def test_revoke_nonexistent_permission(self):
         """Test revoking permission that user doesn't have."""
         user = User.create(Email("test@example.com"), Password("ValidPass123"))
-        old_permissions = user.permissions.copy()
+        old_permissions = set(user.permissions)
 
         user.revoke_permission("nonexistent")
 
@@ -182,8 +194,8 @@ class TestSession:
         assert isinstance(session.id, SessionIdValue)
         assert session.user_id == user_id
         assert session.email == email
-        assert session.permissions == permissions
-        assert session.permissions is not permissions  # Should be a copy
+        assert session.permissions == tuple(permissions)
+        assert session.permissions is not permissions  # Frozen, not shared
         assert isinstance(session.created_at, datetime)
         assert isinstance(session.expires_at, datetime)
         assert session.expires_at > session.created_at
@@ -240,8 +252,8 @@ class TestSession:
 
         claims = session.to_token_claims()
 
-        assert claims.user_id == str(user_id)
-        assert claims.session_id == str(session.id)
+        assert claims.user_id is user_id  # Typed ids are passed through
+        assert claims.session_id is session.id
         assert claims.email == str(email)
         assert claims.permissions == tuple(permissions)
         assert claims.permissions is not permissions  # Should be a copy
@@ -0,0 +1,94 @@
+"""Tests for PostgreSQL row mappers."""
+
+import uuid
+from datetime import UTC, datetime, timedelta
+
+from heimdall.infrastructure.persistence.postgres.mappers import (
+    ACTIVE_SESSION_COLUMNS,
+    SESSION_COLUMNS,
+    USER_COLUMNS,
+    row_to_active_session,
+    row_to_session,
+    row_to_user,
+)
+
+
+def _row(columns, **values):
+    """Build a positional row in the given column order."""
+    return tuple(values[column] for column in columns)
+
+
+class TestRowMappers:
+    """Test positional row unpacking in the mappers."""
+
+    def test_row_to_user(self):
+        """Test a user row maps field by field in USER_COLUMNS order."""
+        # Arrange
+        user_id = uuid.uuid4()
+        now = datetime.now(UTC)
+        row = _row(
+            USER_COLUMNS,
+            id=user_id,
+            email="test@example.com",
+            password_hash="$2b$12$hash",
+            status="active",
+            is_verified=True,
+            created_at=now,
+            updated_at=now,
+            last_login_at=None,
+        )
+
+        # Act
+        user = row_to_user(row)
+
+        # Assert
+        assert user.id.value == str(user_id)
+        assert user.email.value == "test@example.com"
+        assert user.password_hash.value == "$2b$12$hash"
+        assert user.is_active is True
+        assert user.is_verified is True
+        assert user.created_at == now
+        assert user.last_login_at is None
+
+    def test_row_to_session(self):
+        """Test a session row maps its status to is_active."""
+        # Arrange
+        now = datetime.now(UTC)
+        row = _row(
+            SESSION_COLUMNS,
+            id=uuid.uuid4(),
+            user_id=uuid.uuid4(),
+            created_at=now,
+            expires_at=now + timedelta(hours=1),
+            status="invalidated",
+            email="test@example.com",
+        )
+
+        # Act
+        session = row_to_session(row)
+
+        # Assert
+        assert session.is_active is False
+        assert session.email.value == "test@example.com"
+        assert session.expires_at == now + timedelta(hours=1)
+
+    def test_row_to_active_session(self):
+        """Test active-only rows carry no status and map to active sessions."""
+        # Arrange
+        session_id = uuid.uuid4()
+        now = datetime.now(UTC)
+        row = _row(
+            ACTIVE_SESSION_COLUMNS,
+            id=session_id,
+            user_id=uuid.uuid4(),
+            created_at=now,
+            expires_at=now + timedelta(hours=1),
+            email="test@example.com",
+        )
+
+        # Act
+        session = row_to_active_session(row)
+
+        # Assert
+        assert session.id.value == str(session_id)
+        assert session.is_valid() is True
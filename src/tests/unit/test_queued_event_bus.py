@@ -0,0 +1,173 @@
+"""Tests for the queue-backed event bus."""
+
+import asyncio
+
+import pytest
+
+from heimdall.domain.events import UserCreated
+from heimdall.domain.value_objects import Email, generate_user_id
+from heimdall.infrastructure.messaging import QueuedEventBus
+
+
+def _event():
+    return UserCreated(user_id=generate_user_id(), email=Email("test@example.com"))
+
+
+class TestQueuedEventBus:
+    """Test QueuedEventBus batching and delivery."""
+
+    @pytest.mark.asyncio
+    async def test_publish_does_not_wait_for_sink(self):
+        """Test publish returns before the sink is called."""
+        # Arrange
+        delivered = []
+
+        async def sink(batch):
+            delivered.extend(batch)
+
+        bus = QueuedEventBus(sink)
+
+        # Act
+        await bus.publish(_event())
+
+        # Assert
+        assert delivered == []
+        await bus.stop()
+
+    @pytest.mark.asyncio
+    async def test_first_publish_starts_flushing(self):
+        """Test events are delivered without an explicit start()."""
+        # Arrange
+        delivered = []
+
+        async def sink(batch):
+            delivered.extend(batch)
+
+        bus = QueuedEventBus(sink, max_delay=0)
+        event = _event()
+
+        # Act
+        await bus.publish(event)
+        await asyncio.sleep(0.01)
+
+        # Assert
+        assert delivered == [event]
+        await bus.stop()
+
+    @pytest.mark.asyncio
+    async def test_events_are_flushed_in_batches(self):
+        """Test queued events reach the sink grouped into batches."""
+        # Arrange
+        batches = []
+
+        async def sink(batch):
+            batches.append(list(batch))
+
+        bus = QueuedEventBus(sink, max_batch=2, max_delay=0.01)
+        events = [_event() for _ in range(3)]
+
+        # Act
+        for event in events:
+            await bus.publish(event)
+        bus.start()
+        await asyncio.sleep(0.05)
+        await bus.stop()
+
+        # Assert
+        assert batches == [events[:2], events[2:]]
+
+    @pytest.mark.asyncio
+    async def test_stop_delivers_pending_events(self):
+        """Test stopping the bus flushes events that were never drained."""
+        # Arrange
+        delivered = []
+
+        async def sink(batch):
+            delivered.extend(batch)
+
+        bus = QueuedEventBus(sink)
+        event = _event()
+        await bus.publish(event)
+
+        # Act
+        await bus.stop()
+
+        # Assert
+        assert delivered == [event]
+
+    @pytest.mark.asyncio
+    async def test_sink_failure_does_not_stop_delivery(self):
+        """Test a failing flush is logged and later batches still go out."""
+        # Arrange
+        delivered = []
+        calls = 0
+
+        async def sink(batch):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise RuntimeError("transport down")
+            delivered.extend(batch)
+
+        bus = QueuedEventBus(sink, max_delay=0)
+        bus.start()
+
+        # Act
+        await bus.publish(_event())
+        await asyncio.sleep(0.01)
+        second = _event()
+        await bus.publish(second)
+        await asyncio.sleep(0.01)
+        await bus.stop()
+
+        # Assert
+        assert delivered == [second]
+
+    def test_bus_survives_restart_on_a_new_loop(self):
+        """Test a bus stopped on one loop delivers again on the next."""
+        # Arrange
+        delivered = []
+
+        async def sink(batch):
+            delivered.extend(batch)
+
+        bus = QueuedEventBus(sink, max_delay=0)
+        events = [_event() for _ in range(4)]
+
+        async def serve(first, second):
+            bus.start()
+            for event in (first, second):
+                await bus.publish(event)
+                await asyncio.sleep(0.01)
+            flushed = list(delivered)  # delivered by the task, not by stop()
+            await bus.stop()
+            return flushed
+
+        # Act
+        flushed = [asyncio.run(serve(*events[:2])), asyncio.run(serve(*events[2:]))]
+
+        # Assert
+        assert flushed == [events[:2], events]
+
+    @pytest.mark.asyncio
+    async def test_publish_restarts_dead_flush_task(self):
+        """Test a flush task that crashed is replaced on the next publish."""
+        # Arrange
+        delivered = []
+
+        async def sink(batch):
+            delivered.extend(batch)
+
+        bus = QueuedEventBus(sink, max_delay=0)
+        bus.start()
+        bus._task.cancel()
+        await asyncio.sleep(0)
+        event = _event()
+
+        # Act
+        await bus.publish(event)
+        await asyncio.sleep(0.01)
+
+        # Assert
+        assert delivered == [event]
+        await bus.stop()
@@ -0,0 +1,240 @@
+"""Tests for the Redis cache-aside session repositories."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from heimdall.domain.entities import Session
+from heimdall.domain.value_objects import Email, generate_session_id, generate_user_id
+from heimdall.infrastructure.persistence.redis import (
+    SESSION_KEY_PREFIX,
+    RedisReadSessionRepository,
+    RedisWriteSessionRepository,
+)
+
+
+class _FakeRedis:
+    """Dict-backed stand-in for the few Redis commands the repositories use."""
+
+    def __init__(self):
+        self.data = {}
+        self.ttls = {}
+        self.mget_calls = 0
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None, nx=False):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        self.ttls[key] = ex
+        return True
+
+    async def delete(self, key):
+        self.data.pop(key, None)
+
+    async def mget(self, keys):
+        self.mget_calls += 1
+        return [self.data.get(key) for key in keys]
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+
+class _FakePipeline:
+    """Buffer SETs and apply them on execute, like a Redis pipeline."""
+
+    def __init__(self, client):
+        self._client = client
+        self._commands = []
+
+    def set(self, key, value, ex=None, nx=False):
+        self._commands.append((key, value, ex, nx))
+
+    def __len__(self):
+        return len(self._commands)
+
+    async def execute(self):
+        for key, value, ex, nx in self._commands:
+            await self._client.set(key, value, ex=ex, nx=nx)
+
+
+def _session(expires_in=timedelta(hours=24)):
+    return Session(
+        id=generate_session_id(),
+        user_id=generate_user_id(),
+        email=Email("test@example.com"),
+        permissions=("user:read",),
+        expires_at=datetime.now(UTC) + expires_in,
+    )
+
+
+class TestRedisReadSessionRepository:
+    """Test RedisReadSessionRepository cache-aside reads."""
+
+    @pytest.mark.asyncio
+    async def test_miss_loads_from_fallback_and_caches(self):
+        """Test a miss reads the fallback once and serves the next read."""
+        # Arrange
+        session = _session()
+        client = _FakeRedis()
+        fallback = AsyncMock()
+        fallback.find_by_id.return_value = session
+        repo = RedisReadSessionRepository(client, fallback)
+
+        # Act
+        first = await repo.find_by_id(session.id)
+        second = await repo.find_by_id(session.id)
+
+        # Assert
+        assert first is session
+        assert second == session
+        assert second.email.domain == "example.com"
+        fallback.find_by_id.assert_awaited_once_with(session.id)
+        assert client.ttls[SESSION_KEY_PREFIX + session.id.value] == 300
+
+    @pytest.mark.asyncio
+    async def test_ttl_never_outlives_session(self):
+        """Test cached entries expire no later than the session."""
+        # Arrange
+        session = _session(expires_in=timedelta(seconds=30))
+        client = _FakeRedis()
+        fallback = AsyncMock()
+        fallback.find_by_id.return_value = session
+        repo = RedisReadSessionRepository(client, fallback)
+
+        # Act
+        await repo.find_by_id(session.id)
+
+        # Assert
+        assert client.ttls[SESSION_KEY_PREFIX + session.id.value] <= 30
+
+    @pytest.mark.asyncio
+    async def test_missing_session_is_not_cached(self):
+        """Test unknown sessions always go to the fallback."""
+        # Arrange
+        client = _FakeRedis()
+        fallback = AsyncMock()
+        fallback.find_by_id.return_value = None
+        repo = RedisReadSessionRepository(client, fallback)
+
+        # Act
+        result = await repo.find_by_id(generate_session_id())
+
+        # Assert
+        assert result is None
+        assert client.data == {}
+
+    @pytest.mark.asyncio
+    async def test_redis_errors_fall_back(self):
+        """Test an unreachable Redis degrades to the fallback repository."""
+        # Arrange
+        session = _session()
+        client = AsyncMock()
+        client.get.side_effect = RedisConnectionError("down")
+        fallback = AsyncMock()
+        fallback.find_by_id.return_value = session
+        repo = RedisReadSessionRepository(client, fallback)
+
+        # Act
+        result = await repo.find_by_id(session.id)
+
+        # Assert
+        assert result is session
+
+    @pytest.mark.asyncio
+    async def test_find_by_ids_uses_one_mget(self):
+        """Test a multi-session lookup reads Redis once and fills misses."""
+        # Arrange
+        cached, missing = _session(), _session()
+        client = _FakeRedis()
+        fallback = AsyncMock()
+        fallback.find_by_id.return_value = cached
+        repo = RedisReadSessionRepository(client, fallback)
+        await repo.find_by_id(cached.id)
+        fallback.find_by_id.reset_mock()
+        fallback.find_by_id.return_value = missing
+
+        # Act
+        found = await repo.find_by_ids([cached.id, missing.id, missing.id])
+        again = await repo.find_by_ids([cached.id, missing.id])
+
+        # Assert
+        assert set(found) == {cached.id.value, missing.id.value}
+        assert found[missing.id.value] is missing
+        assert again[cached.id.value] == cached
+        assert client.mget_calls == 2
+        fallback.find_by_id.assert_awaited_once_with(missing.id)
+
+
+class TestRedisWriteSessionRepository:
+    """Test RedisWriteSessionRepository invalidation."""
+
+    @pytest.mark.asyncio
+    async def test_save_invalidates_cached_session(self):
+        """Test saving an invalidated session revokes its cached copy."""
+        # Arrange
+        session = _session()
+        client = _FakeRedis()
+        fallback = AsyncMock()
+        fallback.find_by_id.return_value = session
+        reader = RedisReadSessionRepository(client, fallback)
+        inner = AsyncMock()
+        writer = RedisWriteSessionRepository(client, inner)
+        await reader.find_by_id(session.id)
+
+        # Act
+        session.invalidate()
+        await writer.save(session)
+
+        # Assert
+        inner.save.assert_awaited_once_with(session)
+        assert await reader.find_by_id(session.id) is None
+        assert await reader.find_by_ids([session.id]) == {}
+
+    @pytest.mark.asyncio
+    async def test_stale_fill_after_logout_cannot_resurrect_session(self):
+        """Test a cache fill from a stale row landing after logout is dropped."""
+        # Arrange
+        session = _session()
+        stale = _session()
+        stale.id = session.id
+        client = _FakeRedis()
+        fallback = AsyncMock()
+        reader = RedisReadSessionRepository(client, fallback)
+        writer = RedisWriteSessionRepository(client, AsyncMock())
+
+        async def load_then_logout(session_id):
+            # The reader has missed and loaded the still-active row; logout
+            # commits before its cache fill runs
+            session.invalidate()
+            await writer.save(session)
+            return stale
+
+        fallback.find_by_id.side_effect = load_then_logout
+
+        # Act
+        first = await reader.find_by_id(session.id)
+        second = await reader.find_by_id(session.id)
+
+        # Assert
+        assert first is stale
+        assert second is None
+
+    @pytest.mark.asyncio
+    async def test_saving_active_session_drops_cached_copy(self):
+        """Test saving an active session just deletes any cached copy."""
+        # Arrange
+        session = _session()
+        client = _FakeRedis()
+        client.data[SESSION_KEY_PREFIX + session.id.value] = b"[]"
+        writer = RedisWriteSessionRepository(client, AsyncMock())
+
+        # Act
+        await writer.save(session)
+
+        # Assert
+        assert client.data == {}
@@ -1,7 +1,13 @@
 """Tests for CQRS repository interface separation."""
 
+from dataclasses import fields
+
+import pytest
+
 from heimdall.application.commands.auth_commands import Dependencies as CommandDeps
 from heimdall.application.queries.auth_queries import Dependencies as QueryDeps
+from heimdall.domain.events import DomainEvent
+from heimdall.domain.repositories.event_repository import EventRepository
 from heimdall.domain.repositories.read_repositories import ReadSessionRepository
 from heimdall.domain.repositories.write_repositories import (
     WriteSessionRepository,
@@ -63,8 +69,8 @@ class TestRepositoryInterfaceSeparation:
     def test_dependency_minimization_principle(self):
         """Test that read repositories enforce minimal dependencies principle."""
         # Command dependencies should have more fields (full context)
-        command_fields = set(CommandDeps._fields)
-        query_fields = set(QueryDeps._fields)
+        command_fields = {f.name for f in fields(CommandDeps)}
+        query_fields = {f.name for f in fields(QueryDeps)}
 
         # Assert queries have fewer dependencies than commands
         assert len(query_fields) < len(command_fields)
@@ -76,3 +82,34 @@ class TestRepositoryInterfaceSeparation:
         # But commands should have all dependencies
         assert "user_repository" in command_fields
         assert "event_bus" in command_fields
+
+
+class TestEventRepositoryBatching:
+    """Test the default batch save of EventRepository."""
+
+    @pytest.mark.asyncio
+    async def test_save_many_defaults_to_save_per_event(self):
+        """Test implementations without a batch write still save every event."""
+
+        # Arrange
+        class _ListEventRepository(EventRepository):
+            def __init__(self):
+                self.saved = []
+
+            async def save(self, event):
+                self.saved.append(event)
+
+            async def find_by_aggregate_id(self, aggregate_id):
+                return []
+
+            async def find_by_time_range(self, start_time, end_time):
+                return []
+
+        repo = _ListEventRepository()
+        events = [DomainEvent("Test", {"n": n}) for n in range(3)]
+
+        # Act
+        await repo.save_many(events)
+
+        # Assert
+        assert repo.saved == events
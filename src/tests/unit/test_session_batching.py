@@ -0,0 +1,142 @@
+"""Tests for coalescing read-side session lookups."""
+
+import asyncio
+
+import pytest
+
+from heimdall.domain.entities import Session
+from heimdall.domain.value_objects import Email, generate_session_id, generate_user_id
+from heimdall.infrastructure.persistence.batching import (
+    BatchingReadSessionRepository,
+)
+
+
+def _session(session_id):
+    return Session(
+        id=session_id,
+        user_id=generate_user_id(),
+        email=Email("test@example.com"),
+        permissions=[],
+    )
+
+
+class TestBatchingReadSessionRepository:
+    """Test BatchingReadSessionRepository coalescing."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_share_one_load(self):
+        """Test concurrent find_by_id calls are resolved by a single batch."""
+        # Arrange
+        ids = [generate_session_id() for _ in range(3)]
+        sessions = {str(sid): _session(sid) for sid in ids[:2]}
+        calls = []
+
+        async def load_many(session_ids):
+            calls.append(list(session_ids))
+            return sessions
+
+        repo = BatchingReadSessionRepository(load_many, window=0.001)
+
+        # Act
+        results = await asyncio.gather(
+            *(repo.find_by_id(sid) for sid in ids),
+            repo.find_by_id(ids[0]),
+        )
+
+        # Assert
+        assert len(calls) == 1
+        assert calls[0] == ids
+        first, second = sessions[str(ids[0])], sessions[str(ids[1])]
+        assert results == [first, second, None, first]
+
+    @pytest.mark.asyncio
+    async def test_max_batch_dispatches_immediately(self):
+        """Test a full batch is loaded without waiting for the window."""
+        # Arrange
+        calls = []
+
+        async def load_many(session_ids):
+            calls.append(len(session_ids))
+            return {}
+
+        repo = BatchingReadSessionRepository(load_many, window=10, max_batch=2)
+
+        # Act
+        await asyncio.wait_for(
+            asyncio.gather(
+                repo.find_by_id(generate_session_id()),
+                repo.find_by_id(generate_session_id()),
+            ),
+            timeout=1,
+        )
+
+        # Assert
+        assert calls == [2]
+
+    @pytest.mark.asyncio
+    async def test_load_failure_reaches_every_caller(self):
+        """Test a failed batch load raises for each waiting lookup."""
+
+        # Arrange
+        async def load_many(session_ids):
+            raise ConnectionError("database unavailable")
+
+        repo = BatchingReadSessionRepository(load_many, window=0.001)
+
+        # Act
+        results = await asyncio.gather(
+            repo.find_by_id(generate_session_id()),
+            repo.find_by_id(generate_session_id()),
+            return_exceptions=True,
+        )
+
+        # Assert
+        assert all(isinstance(result, ConnectionError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_load_releases_every_caller(self):
+        """Test cancelling an in-flight load does not leave callers hanging."""
+        # Arrange
+        started = asyncio.Event()
+
+        async def load_many(session_ids):
+            started.set()
+            await asyncio.Event().wait()
+
+        repo = BatchingReadSessionRepository(load_many, window=0)
+        lookups = [
+            asyncio.create_task(repo.find_by_id(generate_session_id()))
+            for _ in range(2)
+        ]
+        await started.wait()
+
+        # Act
+        await repo.close()
+        results = await asyncio.wait_for(
+            asyncio.gather(*lookups, return_exceptions=True), timeout=1
+        )
+
+        # Assert
+        assert all(isinstance(r, asyncio.CancelledError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_close_cancels_queued_lookups(self):
+        """Test lookups still waiting for the window are released by close."""
+        # Arrange
+        calls = []
+
+        async def load_many(session_ids):
+            calls.append(session_ids)
+            return {}
+
+        repo = BatchingReadSessionRepository(load_many, window=10)
+        lookup = asyncio.create_task(repo.find_by_id(generate_session_id()))
+        await asyncio.sleep(0)
+
+        # Act
+        await repo.close()
+        result = await asyncio.gather(lookup, return_exceptions=True)
+
+        # Assert
+        assert isinstance(result[0], asyncio.CancelledError)
+        assert calls == []
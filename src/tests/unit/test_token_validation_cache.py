@@ -0,0 +1,231 @@
+"""Tests for the token validation cache on the query side."""
+
+import sys
+import time
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from heimdall.application.commands import CommandDependencies, logout_user_command
+from heimdall.application.dto import ValidateTokenResponse
+from heimdall.application.queries import (
+    QueryDependencies,
+    TokenValidationCache,
+    validate_token_query,
+)
+from heimdall.domain.value_objects import Token, TokenClaims, generate_session_id
+
+
+class TestTokenValidationCache:
+    """Test TokenValidationCache behaviour."""
+
+    def test_key_does_not_contain_raw_token(self):
+        """Test cache keys are fixed-size digests, not the token itself."""
+        key = TokenValidationCache.key_for("header.payload.signature")
+
+        assert isinstance(key, bytes)
+        assert len(key) == 16
+        assert b"signature" not in key
+
+    def test_put_and_get(self):
+        """Test a cached response is returned on hit."""
+        cache = TokenValidationCache()
+        key = cache.key_for("header.payload.signature")
+        response = ValidateTokenResponse(is_valid=True, user_id="user123")
+
+        cache.put(key, response, datetime.now(UTC) + timedelta(minutes=15))
+
+        assert cache.get(key) is response
+
+    def test_entry_never_outlives_token(self):
+        """Test already-expired tokens are not cached."""
+        cache = TokenValidationCache()
+        key = cache.key_for("header.payload.signature")
+        response = ValidateTokenResponse(is_valid=True, user_id="user123")
+
+        cache.put(key, response, datetime.now(UTC) - timedelta(seconds=1))
+
+        assert cache.get(key) is None
+        assert len(cache) == 0
+
+    def test_expired_entry_is_evicted(self):
+        """Test entries past their TTL are dropped on lookup."""
+        cache = TokenValidationCache(ttl=0.001)
+        key = cache.key_for("header.payload.signature")
+        response = ValidateTokenResponse(is_valid=True, user_id="user123")
+
+        cache.put(key, response, datetime.now(UTC) + timedelta(minutes=15))
+        time.sleep(0.01)
+
+        assert cache.get(key) is None
+
+    def test_lru_eviction_respects_maxsize(self):
+        """Test least recently used entries are evicted first."""
+        cache = TokenValidationCache(maxsize=2)
+        expires_at = datetime.now(UTC) + timedelta(minutes=15)
+        first, second, third = (cache.key_for(f"a.b.{i}") for i in range(3))
+
+        cache.put(first, ValidateTokenResponse(is_valid=True), expires_at)
+        cache.put(second, ValidateTokenResponse(is_valid=True), expires_at)
+        cache.get(first)  # first becomes most recently used
+        cache.put(third, ValidateTokenResponse(is_valid=True), expires_at)
+
+        assert cache.get(first) is not None
+        assert cache.get(second) is None
+        assert cache.get(third) is not None
+
+    def test_evict_session_drops_all_its_entries(self):
+        """Test revoking a session evicts every token cached for it."""
+        cache = TokenValidationCache()
+        expires_at = datetime.now(UTC) + timedelta(minutes=15)
+        first, second, other = (cache.key_for(f"a.b.{i}") for i in range(3))
+
+        cache.put(first, ValidateTokenResponse(is_valid=True), expires_at, "s1")
+        cache.put(second, ValidateTokenResponse(is_valid=True), expires_at, "s1")
+        cache.put(other, ValidateTokenResponse(is_valid=True), expires_at, "s2")
+        cache.evict_session("s1")
+
+        assert cache.get(first) is None
+        assert cache.get(second) is None
+        assert cache.get(other) is not None
+
+
+class TestValidateTokenQueryCaching:
+    """Test validate_token_query integration with the cache."""
+
+    def _deps(self, claims, session, cache):
+        token_service = Mock()
+        token_service.validate_token.return_value = claims
+
+        session_repo = AsyncMock()
+        session_repo.find_by_id.return_value = session
+
+        return QueryDependencies(
+            session_repository=session_repo,
+            token_service=token_service,
+            token_cache=cache,
+        )
+
+    @pytest.mark.asyncio
+    async def test_repeated_validation_hits_cache(self):
+        """Test second validation of a token skips decode and lookup."""
+        # Arrange
+        claims = TokenClaims("user123", str(generate_session_id()), "a@b.com")
+        session = Mock(
+            user_id=claims.user_id,
+            email=claims.email,
+            permissions=claims.permissions,
+        )
+        session.is_valid.return_value = True
+        deps = self._deps(claims, session, TokenValidationCache())
+        token = Token("cached.jwt.token")
+
+        # Act
+        first = await validate_token_query(token, deps)
+        second = await validate_token_query(token, deps)
+
+        # Assert
+        assert first.is_valid is True
+        assert second is first
+        deps.token_service.validate_token.assert_called_once()
+        deps.session_repository.find_by_id.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_invalid_results_are_not_cached(self):
+        """Test failed validations always go through the full path."""
+        # Arrange
+        claims = TokenClaims("user123", str(generate_session_id()), "a@b.com")
+        cache = TokenValidationCache()
+        deps = self._deps(claims, None, cache)
+        token = Token("missing.session.token")
+
+        # Act
+        await validate_token_query(token, deps)
+        result = await validate_token_query(token, deps)
+
+        # Assert
+        assert result.is_valid is False
+        assert len(cache) == 0
+        assert deps.session_repository.find_by_id.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_known_permissions_are_interned(self):
+        """Test known permission names are returned as interned strings."""
+        # Arrange
+        claims = TokenClaims(
+            "user123",
+            str(generate_session_id()),
+            "a@b.com",
+            permissions=["".join(["user", ":read"]), "custom:perm"],
+        )
+        session = Mock(
+            user_id=claims.user_id,
+            email=claims.email,
+            permissions=claims.permissions,
+        )
+        session.is_valid.return_value = True
+        deps = self._deps(claims, session, None)
+
+        # Act
+        result = await validate_token_query(Token("interned.jwt.token"), deps)
+
+        # Assert
+        assert result.permissions == ("user:read", "custom:perm")
+        assert result.permissions[0] is sys.intern("user:read")
+
+    @pytest.mark.asyncio
+    async def test_logout_evicts_cached_validation(self):
+        """Test logging out drops the token's cached validation."""
+        # Arrange
+        claims = TokenClaims("user123", str(generate_session_id()), "a@b.com")
+        session = Mock(
+            user_id=claims.user_id,
+            email=claims.email,
+            permissions=claims.permissions,
+        )
+        session.is_valid.return_value = True
+        cache = TokenValidationCache()
+        query_deps = self._deps(claims, session, cache)
+        command_deps = CommandDependencies(
+            user_repository=AsyncMock(),
+            session_repository=query_deps.session_repository,
+            token_service=query_deps.token_service,
+            event_bus=AsyncMock(),
+            token_cache=cache,
+        )
+        token = Token("revoked.jwt.token")
+        await validate_token_query(token, query_deps)
+
+        # Act
+        await logout_user_command(token, command_deps)
+
+        # Assert
+        assert cache.get(cache.key_for(token.value)) is None
+
+    @pytest.mark.asyncio
+    async def test_logout_broadcasts_revocation(self):
+        """Test logging out announces the session to sibling workers."""
+        # Arrange
+        claims = TokenClaims("user123", str(generate_session_id()), "a@b.com")
+        session = Mock(
+            user_id=claims.user_id,
+            email=claims.email,
+            permissions=claims.permissions,
+        )
+        session.is_valid.return_value = True
+        query_deps = self._deps(claims, session, None)
+        invalidator = AsyncMock()
+        command_deps = CommandDependencies(
+            user_repository=AsyncMock(),
+            session_repository=query_deps.session_repository,
+            token_service=query_deps.token_service,
+            event_bus=AsyncMock(),
+            cache_invalidator=invalidator,
+        )
+
+        # Act
+        await logout_user_command(Token("revoked.jwt.token"), command_deps)
+
+        # Assert
+        invalidator.publish.assert_awaited_once_with(claims.session_id.value)
@@ -0,0 +1,175 @@
+"""Tests for the in-process user lookup cache."""
+
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+
+from heimdall.domain.entities import User
+from heimdall.domain.value_objects import Email, Password
+from heimdall.infrastructure.persistence.caching import CachingUserRepository
+
+
+def _user():
+    return User.create(Email("test@example.com"), Password("ValidPass123"))
+
+
+class TestCachingUserRepository:
+    """Test CachingUserRepository lookups and invalidation."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_lookup_hits_cache(self):
+        """Test the second lookup of an email skips the wrapped repository."""
+        # Arrange
+        user = _user()
+        inner = AsyncMock()
+        inner.find_by_email.return_value = user
+        repo = CachingUserRepository(inner)
+
+        # Act
+        first = await repo.find_by_email(user.email)
+        second = await repo.find_by_email(user.email)
+
+        # Assert
+        assert first is user
+        assert second == user
+        assert second is not first
+        inner.find_by_email.assert_awaited_once_with(user.email)
+
+    @pytest.mark.asyncio
+    async def test_unknown_email_is_not_cached(self):
+        """Test misses always go to the wrapped repository."""
+        # Arrange
+        inner = AsyncMock()
+        inner.find_by_email.return_value = None
+        repo = CachingUserRepository(inner)
+        email = Email("missing@example.com")
+
+        # Act
+        await repo.find_by_email(email)
+        result = await repo.find_by_email(email)
+
+        # Assert
+        assert result is None
+        assert inner.find_by_email.await_count == 2
+        assert len(repo) == 0
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_reloaded(self):
+        """Test entries past their TTL are fetched again."""
+        # Arrange
+        user = _user()
+        inner = AsyncMock()
+        inner.find_by_email.return_value = user
+        repo = CachingUserRepository(inner, ttl=0.001)
+
+        # Act
+        await repo.find_by_email(user.email)
+        time.sleep(0.01)
+        await repo.find_by_email(user.email)
+
+        # Assert
+        assert inner.find_by_email.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_save_invalidates_cached_user(self):
+        """Test saving a user drops its cached copy."""
+        # Arrange
+        user = _user()
+        inner = AsyncMock()
+        inner.find_by_email.return_value = user
+        repo = CachingUserRepository(inner)
+        await repo.find_by_email(user.email)
+
+        # Act
+        await repo.save(user)
+        await repo.find_by_email(user.email)
+
+        # Assert
+        inner.save.assert_awaited_once_with(user)
+        assert inner.find_by_email.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction_respects_maxsize(self):
+        """Test the least recently used email is evicted first."""
+        # Arrange
+        inner = AsyncMock()
+        inner.find_by_email.side_effect = lambda email: User.create(
+            email, Password("ValidPass123")
+        )
+        repo = CachingUserRepository(inner, maxsize=2)
+        first, second, third = (Email(f"u{i}@example.com") for i in range(3))
+
+        # Act
+        await repo.find_by_email(first)
+        await repo.find_by_email(second)
+        await repo.find_by_email(first)  # first becomes most recently used
+        await repo.find_by_email(third)
+
+        # Assert
+        assert len(repo) == 2
+        await repo.find_by_email(second)
+        assert inner.find_by_email.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_find_by_emails_batches_only_misses(self):
+        """Test cached emails are served locally and the rest load in one call."""
+        # Arrange
+        cached = _user()
+        other = User.create(Email("other@example.com"), Password("ValidPass123"))
+        inner = AsyncMock()
+        inner.find_by_email.return_value = cached
+        inner.find_by_emails.return_value = {other.email.value: other}
+        repo = CachingUserRepository(inner)
+        await repo.find_by_email(cached.email)
+
+        # Act
+        found = await repo.find_by_emails([cached.email, other.email])
+        again = await repo.find_by_email(other.email)
+
+        # Assert
+        assert found == {cached.email.value: cached, other.email.value: other}
+        inner.find_by_emails.assert_awaited_once_with([other.email])
+        assert again == other
+        inner.find_by_email.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_callers_cannot_mutate_cached_user(self):
+        """Test changes to a returned user do not leak into the cache."""
+        # Arrange
+        user = _user()
+        inner = AsyncMock()
+        inner.find_by_email.return_value = user
+        repo = CachingUserRepository(inner)
+        await repo.find_by_email(user.email)
+
+        # Act
+        mine = await repo.find_by_email(user.email)
+        mine.authenticate(Password("ValidPass123"))
+        mine.permissions.add("admin")
+        theirs = await repo.find_by_email(user.email)
+
+        # Assert
+        assert theirs.last_login_at is None
+        assert theirs.permissions == set()
+
+    @pytest.mark.asyncio
+    async def test_load_overlapping_save_is_not_cached(self):
+        """Test a read that races a save cannot cache the pre-save user."""
+        # Arrange
+        old = _user()
+        inner = AsyncMock()
+        repo = CachingUserRepository(inner)
+
+        async def load_then_save(email):
+            # The row was read before the save committed
+            await repo.save(old)
+            return old
+
+        inner.find_by_email.side_effect = load_then_save
+
+        # Act
+        await repo.find_by_email(old.email)
+
+        # Assert
+        assert len(repo) == 0
@@ -1,5 +1,7 @@
 """Tests for value objects."""
 
+import base64
+import json
 from datetime import UTC, datetime, timedelta
 
 import pytest
@@ -9,13 +11,16 @@ from heimdall.domain.value_objects import (
     Password,
     PasswordHash,
     SessionId,
+    SessionIdFromTrusted,
     Token,
     TokenClaims,
     TokenClaimsFromDict,
     UserId,
+    UserIdFromTrusted,
     generate_session_id,
     generate_user_id,
     hash_password,
+    peek_expiry,
     verify_password,
 )
 
@@ -50,6 +55,15 @@ class TestEmail:
         with pytest.raises(ValueError, match="Invalid email format"):
             Email("user@")
 
+    def test_repeated_construction_is_memoized(self):
+        """Test the same address yields the same cached value object."""
+        assert Email("memo@example.com") is Email("memo@example.com")
+
+    def test_non_ascii_email_rejected(self):
+        """Test non-ASCII characters are rejected rather than case-folded."""
+        with pytest.raises(ValueError, match="Invalid email format"):
+            Email("\u212aelvin@example.com")  # Kelvin sign lowercases to "k"
+
     def test_empty_email(self):
         """Test empty email raises ValueError."""
         with pytest.raises(ValueError, match="Email cannot be empty"):
@@ -161,6 +175,11 @@ class TestUserId:
         with pytest.raises(ValueError, match="User ID cannot be empty"):
             UserId("")
 
+    def test_from_trusted_matches_validated(self):
+        """Test trusted construction yields an equal value object."""
+        uuid_str = "550e8400-e29b-41d4-a716-446655440000"
+        assert UserIdFromTrusted(uuid_str) == UserId(uuid_str)
+
 
 class TestSessionId:
     """Test SessionId value object."""
@@ -188,6 +207,17 @@ class TestSessionId:
         with pytest.raises(ValueError, match="Session ID cannot be empty"):
             SessionId("")
 
+    def test_repeated_construction_is_memoized(self):
+        """Test the same id string yields the same cached value object."""
+        session_id = str(generate_session_id())
+
+        assert SessionId(session_id) is SessionId(session_id)
+
+    def test_from_trusted_matches_validated(self):
+        """Test trusted construction yields an equal value object."""
+        uuid_str = "550e8400-e29b-41d4-a716-446655440000"
+        assert SessionIdFromTrusted(uuid_str) == SessionId(uuid_str)
+
 
 class TestTokenClaims:
     """Test TokenClaims value object."""
@@ -197,8 +227,8 @@ class TestTokenClaims:
         claims = TokenClaims(
             user_id="user-123", session_id="session-456", email="test@example.com"
         )
-        assert claims.user_id == "user-123"
-        assert claims.session_id == "session-456"
+        assert claims.user_id.value == "user-123"
+        assert claims.session_id.value == "session-456"
         assert claims.email == "test@example.com"
         assert claims.permissions == ()
         assert isinstance(claims.issued_at, datetime)
@@ -280,8 +310,8 @@ class TestTokenClaims:
         }
 
         claims = TokenClaimsFromDict(data)
-        assert claims.user_id == "user-123"
-        assert claims.session_id == "session-456"
+        assert claims.user_id.value == "user-123"
+        assert claims.session_id.value == "session-456"
         assert claims.email == "test@example.com"
         assert claims.permissions == ("read", "write")
         assert abs((claims.issued_at - now).total_seconds()) < 1
@@ -318,3 +348,29 @@ class TestToken:
         )
         token = Token("header.payload.signature", claims)
         assert token.claims == claims
+
+
+class TestPeekExpiry:
+    """Test reading the unverified expiry claim."""
+
+    @staticmethod
+    def _token(payload) -> str:
+        encoded = base64.urlsafe_b64encode(json.dumps(payload).encode())
+        return f"header.{encoded.decode().rstrip('=')}.signature"
+
+    def test_reads_exp_claim(self):
+        """Test the exp claim is read from an unpadded payload."""
+        token = Token(self._token({"sub": "user-123", "exp": 1000000000}))
+
+        assert peek_expiry(token) == 1000000000
+
+    def test_missing_exp_claim(self):
+        """Test payloads without an expiry return None."""
+        token = Token(self._token({"sub": "user-123"}))
+
+        assert peek_expiry(token) is None
+
+    def test_undecodable_payload(self):
+        """Test non-JSON payloads return None instead of raising."""
+        assert peek_expiry(Token("header.payload.signature")) is None
+        assert peek_expiry(Token(self._token([1, 2, 3]))) is None